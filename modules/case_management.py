@@ -17,6 +17,7 @@ Features:
 """
 
 import datetime
+import hashlib
 import uuid
 from io import BytesIO
 from collections import defaultdict
@@ -58,6 +59,10 @@ PRIORITY_COLORS = {
     "Medium": "#eab308", "Low": "#22c55e",
 }
 
+_COMPLETENESS_COLUMN = st.column_config.ProgressColumn(
+    "Completeness %", min_value=0, max_value=100, format="%.0f%%",
+)
+
 _GDG_LIGHT_STYLE = """
 <style>
 :root,[data-testid="stDataEditor"],[data-testid="stDataEditor"] > div {
@@ -85,11 +90,13 @@ def init_case_management_state() -> None:
     """Initialize all session-state keys for Case Management."""
     defaults = {
         "cases":               [],
+        "cases_version":       0,
         "case_counter":        0,
         "case_excel_reports":  {},
         "dup_groups":          None,
         "dup_golden_records":  {},
         "dup_source_df":       None,
+        "dup_source_cols":     [],
         "dup_match_columns":   [],
         "case_filter_status":  "All",
         "case_filter_priority":"All",
@@ -144,7 +151,9 @@ def create_case(
                               "action": "Case created", "by": "System"}],
         "extra":            extra or {},
     }
+    # Appending keeps "cases" ordered by created_at; views read it newest-first without sorting
     st.session_state["cases"].append(case)
+    _touch_cases()
     return case
 
 
@@ -162,9 +171,68 @@ def update_case_status(case_id: str, new_status: str, note: str = "", by: str =
                 "action": f"Status changed: {old} → {new_status}" + (f" ({note})" if note else ""),
                 "by": by,
             })
+            _touch_cases()
             break
 
 
+def _touch_cases() -> None:
+    """Bump the cases version so the cached columnar view is rebuilt."""
+    st.session_state["cases_version"] = st.session_state.get("cases_version", 0) + 1
+
+
+_CASE_FRAME_COLS = [
+    "case_id", "title", "type", "priority", "status",
+    "affected_records", "affected_columns", "source", "created_at",
+]
+
+
+_CASE_TABLE_COLUMNS = {
+    "case_id": "Case ID", "title": "Title", "type": "Type", "priority": "Priority",
+    "status": "Status", "affected_records": "Records", "created_at": "Created",
+}
+
+
+def _case_table(cases_df: pd.DataFrame) -> pd.DataFrame:
+    """Display projection of ``cases_frame()`` rows for st.dataframe."""
+    return cases_df[list(_CASE_TABLE_COLUMNS)].rename(columns=_CASE_TABLE_COLUMNS)
+
+
+def _as_category(values: List[str], known: List[str]) -> pd.Categorical:
+    extra = [v for v in dict.fromkeys(values) if v not in known]
+    return pd.Categorical(values, categories=known + extra)
+
+
+def _category_mask(col: pd.Series, value: str) -> np.ndarray:
+    """Equality mask on a categorical column, compared on integer codes."""
+    cats = col.cat.categories
+    if value not in cats:
+        return np.zeros(len(col), dtype=bool)
+    return col.cat.codes.to_numpy() == cats.get_loc(value)
+
+
+def cases_frame() -> pd.DataFrame:
+    """
+    Columnar (one array per field) view of st.session_state["cases"].
+    Rebuilt only when cases are created/updated; status/priority/type are
+    categoricals so counts and filters run on integer codes.
+    """
+    cases = st.session_state["cases"]
+    key   = (st.session_state.get("cases_version", 0), len(cases))
+    cached = st.session_state.get("_cases_df")
+    if cached is not None and st.session_state.get("_cases_df_key") == key:
+        return cached
+
+    df = pd.DataFrame({col: [c.get(col, "") for c in cases] for col in _CASE_FRAME_COLS})
+    df["status"]   = _as_category(df["status"].tolist(),   _CASE_STATUSES)
+    df["priority"] = _as_category(df["priority"].tolist(), _CASE_PRIORITIES)
+    df["type"]     = _as_category(df["type"].tolist(),     _CASE_TYPES)
+    df["affected_records"] = pd.to_numeric(df["affected_records"], errors="coerce").fillna(0).astype("int32")
+
+    st.session_state["_cases_df"]     = df
+    st.session_state["_cases_df_key"] = key
+    return df
+
+
 def auto_create_cases_from_dq(results_df: pd.DataFrame, dim_scores: dict) -> int:
     if results_df is None or results_df.empty:
         return 0
@@ -220,11 +288,20 @@ def profile_columns(df: pd.DataFrame) -> pd.DataFrame:
     non_internal = [c for c in df.columns if not c.startswith("_")]
 
     for col in non_internal:
-        series = df[col].astype(str).str.strip().str.lower()
-        null_pct        = df[col].isna().mean() * 100
-        empty_pct       = (series == "").mean() * 100 + (series == "nan").mean() * 100
+        raw      = df[col]
+        null_pct = raw.isna().mean() * 100 if total > 0 else 0
+
+        # Numeric / datetime columns have no whitespace or case to normalise
+        if pd.api.types.is_numeric_dtype(raw) or pd.api.types.is_datetime64_any_dtype(raw):
+            empty_pct   = 0
+            cardinality = raw.nunique(dropna=True)
+        else:
+            series      = raw.dropna().astype(str).str.strip().str.lower()
+            is_empty    = (series == "") | (series == "nan")
+            empty_pct   = (is_empty.sum() / total * 100) if total > 0 else 0
+            cardinality = series[~is_empty].nunique()
+
         effective_null  = null_pct + empty_pct
-        cardinality     = series[series.notna() & (series != "") & (series != "nan")].nunique()
         uniqueness_pct  = (cardinality / total * 100) if total > 0 else 0
 
         if uniqueness_pct >= 90 and effective_null < 5:
@@ -249,6 +326,101 @@ def profile_columns(df: pd.DataFrame) -> pd.DataFrame:
 #  DUPLICATE DETECTION ENGINE
 # ══════════════════════════════════════════════════════════════════════════
 
+# Above this many candidate rows, fuzzy scoring is restricted to rows sharing a
+# blocking key (the first few normalised characters) — O(N²) → Σ block².
+_FUZZY_BLOCKING_MIN_ROWS = 5000
+_FUZZY_BLOCK_PREFIX      = 3
+
+
+def _fuzzy_group_positions(
+    keys: List[str],
+    threshold: float,
+) -> Tuple[List[List[int]], Dict[int, float]]:
+    """
+    Greedy fuzzy grouping over ``keys`` (by position). Large inputs are split
+    into prefix blocks first and each block is grouped independently.
+    Returns (groups, {member position: similarity to its seed}).
+    """
+    if len(keys) <= _FUZZY_BLOCKING_MIN_ROWS:
+        return _fuzzy_group_block(keys, threshold)
+
+    blocks: Dict[str, List[int]] = defaultdict(list)
+    for pos, key in enumerate(keys):
+        blocks[key[:_FUZZY_BLOCK_PREFIX]].append(pos)
+
+    groups: List[List[int]] = []
+    sims:   Dict[int, float] = {}
+    for members in blocks.values():
+        if len(members) < 2:
+            continue
+        b_groups, b_sims = _fuzzy_group_block([keys[p] for p in members], threshold)
+        groups.extend([members[p] for p in grp] for grp in b_groups)
+        sims.update({members[p]: sim for p, sim in b_sims.items()})
+    groups.sort(key=lambda grp: grp[0])
+    return groups, sims
+
+
+def _fuzzy_group_block(
+    keys: List[str],
+    threshold: float,
+) -> Tuple[List[List[int]], Dict[int, float]]:
+    """
+    Each unvisited key seeds a group with every other unvisited key whose
+    similarity ratio ≥ threshold.
+
+    Uses RapidFuzz's C++ ``cdist`` (scored in row blocks to bound memory) when
+    installed, otherwise falls back to difflib's pure-Python SequenceMatcher.
+    """
+    n       = len(keys)
+    visited = np.zeros(n, dtype=bool)
+    groups: List[List[int]] = []
+    sims:   Dict[int, float] = {}
+
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        process = None
+
+    if process is not None:
+        cutoff = threshold * 100
+        block  = 1024
+        for start in range(0, n, block):
+            scores = process.cdist(
+                keys[start:start + block], keys,
+                scorer=fuzz.ratio, score_cutoff=cutoff,
+                dtype=np.float32, workers=-1,
+            )
+            for off, row in enumerate(scores):
+                i = start + off
+                if visited[i]:
+                    continue
+                hits = np.flatnonzero((row >= cutoff) & ~visited)
+                hits = hits[hits != i]
+                if hits.size:
+                    for j in hits.tolist():
+                        sims[j] = round(float(row[j]) / 100, 3)
+                    grp = [i] + hits.tolist()
+                    groups.append(grp)
+                    visited[grp] = True
+        return groups, sims
+
+    for i in range(n):
+        if visited[i]:
+            continue
+        grp = [i]
+        for j in range(n):
+            if j == i or visited[j]:
+                continue
+            sim = SequenceMatcher(None, keys[i], keys[j]).ratio()
+            if sim >= threshold:
+                grp.append(j)
+                sims[j] = round(sim, 3)
+        if len(grp) > 1:
+            groups.append(grp)
+            visited[grp] = True
+    return groups, sims
+
+
 def detect_duplicates(
     df: pd.DataFrame,
     match_columns: List[str],
@@ -261,7 +433,7 @@ def detect_duplicates(
       _completeness, _recency_rank, _match_type, _similarity_score
     """
     result = df.copy()
-    result["_dup_group_id"]      = np.nan
+    result["_dup_group_id"]      = pd.Series(None, index=result.index, dtype=object)
     result["_is_duplicate"]      = False
     result["_dup_count"]         = 0
     result["_match_type"]        = ""
@@ -269,8 +441,9 @@ def detect_duplicates(
 
     non_internal = [c for c in df.columns if not c.startswith("_")]
     result["_completeness"] = (
-        df[non_internal].notna().sum(axis=1) / max(len(non_internal), 1) * 100
-    ).round(2)
+        (df[non_internal].notna().to_numpy().mean(axis=1) * 100).round(2)
+        if non_internal else 0.0
+    )
 
     # Normalize for matching
     match_df = df[match_columns].copy()
@@ -300,31 +473,14 @@ def detect_duplicates(
 
     # ── Fuzzy matching ─────────────────────────────────────────────────────
     if fuzzy and len(match_columns) == 1:
-        col = match_columns[0]
-        keys = match_df["_match_key"].tolist()
-        indices = match_df.index.tolist()
-        unassigned = [
-            (i, idx) for i, idx in enumerate(indices)
-            if not result.at[idx, "_is_duplicate"]
-        ]
+        free   = ~result["_is_duplicate"].to_numpy(dtype=bool)
+        keys   = match_df["_match_key"].to_numpy()[free].tolist()
+        labels = match_df.index[free]
 
-        visited: set = set()
-        fuzzy_groups: List[List[int]] = []
-
-        for i, idx_a in unassigned:
-            if idx_a in visited:
-                continue
-            grp = [idx_a]
-            for j, idx_b in unassigned:
-                if idx_b == idx_a or idx_b in visited:
-                    continue
-                sim = SequenceMatcher(None, keys[i], keys[j]).ratio()
-                if sim >= threshold:
-                    grp.append(idx_b)
-                    result.at[idx_b, "_similarity_score"] = round(sim, 3)
-            if len(grp) > 1:
-                fuzzy_groups.append(grp)
-                visited.update(grp)
+        pos_groups, pos_sims = _fuzzy_group_positions(keys, threshold)
+        fuzzy_groups: List[List[int]] = [[labels[p] for p in grp] for grp in pos_groups]
+        for p, sim in pos_sims.items():
+            result.at[labels[p], "_similarity_score"] = sim
 
         for grp in fuzzy_groups:
             group_id += 1
@@ -354,6 +510,35 @@ def detect_duplicates(
     return result
 
 
+def _dup_rows(dup_df: pd.DataFrame) -> pd.DataFrame:
+    """Rows flagged ``_is_duplicate``; side-effect free, for ``st.cache_data`` bodies."""
+    return dup_df.loc[dup_df["_is_duplicate"].to_numpy(dtype=bool)]
+
+
+def _dup_only(dup_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rows flagged ``_is_duplicate``. The slice is parked in session state against
+    the ``dup_df`` object, so it is computed once per detection run, not per tab.
+    Uncached callers only — cached functions use ``_dup_rows``.
+    """
+    cached = st.session_state.get("_dup_only_cache")
+    if cached is not None and cached[0] is dup_df:
+        return cached[1]
+    out = _dup_rows(dup_df)
+    st.session_state["_dup_only_cache"] = (dup_df, out)
+    return out
+
+
+def _sorted_group_ids(dup_df: pd.DataFrame) -> np.ndarray:
+    """Sorted duplicate group ids, cached in session state against the ``dup_df`` object."""
+    cached = st.session_state.get("_group_ids_sorted")
+    if cached is not None and cached[0] is dup_df:
+        return cached[1]
+    ids = np.sort(_dup_only(dup_df)["_dup_group_id"].dropna().unique().astype(str))
+    st.session_state["_group_ids_sorted"] = (dup_df, ids)
+    return ids
+
+
 def _auto_create_cases_for_dup_groups(
     dup_df: pd.DataFrame,
     match_columns: List[str],
@@ -365,7 +550,7 @@ def _auto_create_cases_for_dup_groups(
     """
     created = 0
     existing = {c["title"] for c in st.session_state["cases"]}
-    dup_only = dup_df[dup_df["_is_duplicate"]]
+    dup_only = _dup_only(dup_df)
 
     for gid, grp in dup_only.groupby("_dup_group_id"):
         title = f"Dup Group {gid}: {len(grp)} records on [{', '.join(match_columns)}]"
@@ -421,28 +606,87 @@ def identify_golden_record(group_df: pd.DataFrame, strategy: str = "Most Complet
         return int(group_df.index[0])
 
 
+def _survivorship_key(group_df: pd.DataFrame, strategy: str) -> Tuple[Optional[pd.Series], bool]:
+    """Vectorized counterpart of ``identify_golden_record``: (sort key, ascending)."""
+    if strategy == "Most Complete":
+        return group_df["_completeness"], False
+    if strategy == "Most Recent":
+        return group_df["_recency_rank"], True
+    if strategy == "Most Frequent":
+        non_internal = [c for c in group_df.columns if not c.startswith("_")]
+        return pd.Series(group_df[non_internal].notna().to_numpy().sum(axis=1), index=group_df.index), False
+    if strategy == "Source Priority":
+        src_cols = [c for c in group_df.columns
+                    if any(kw in c.lower() for kw in ["source", "system", "origin", "priority"])]
+        if src_cols:
+            return group_df[src_cols[0]], True   # alphabetically first = highest priority
+        return group_df["_completeness"], False
+    return None, True
+
+
 def build_golden_records_df(
     dup_df: pd.DataFrame,
     strategy: str = "Most Complete",
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """Build (golden_df, discards_df) from annotated duplicate dataframe."""
-    non_dup  = dup_df[~dup_df["_is_duplicate"]].copy()
-    dup_only = dup_df[dup_df["_is_duplicate"]].copy()
+    is_dup   = dup_df["_is_duplicate"].to_numpy(dtype=bool)
+    non_dup  = dup_df[~is_dup]
+    dup_only = dup_df[is_dup]
+
+    if dup_only.empty:
+        return non_dup.copy(), pd.DataFrame()
+
+    # Rank every candidate once, then keep the best row per group — one sort instead of a loop
+    # (_surv_pos remembers each row's original position for the discards order)
+    by, ascending = _survivorship_key(dup_only, strategy)
+    ranked = dup_only.assign(_surv_pos=np.arange(len(dup_only)))
+    if by is not None:
+        ranked = ranked.assign(_surv_key=by).sort_values(
+            "_surv_key", ascending=ascending, kind="stable", na_position="last",
+        ).drop(columns="_surv_key")
+    ranked = ranked.sort_values("_dup_group_id", kind="stable")
+
+    is_golden   = ~ranked["_dup_group_id"].duplicated().to_numpy()
+    golden_df   = pd.concat([non_dup, ranked[is_golden].drop(columns="_surv_pos")], ignore_index=False)
+    # Discards keep their original row order within each group
+    discards_df = (ranked[~is_golden]
+                   .sort_values(["_dup_group_id", "_surv_pos"], kind="stable")
+                   .drop(columns="_surv_pos"))
+    if discards_df.empty:
+        discards_df = pd.DataFrame()
+
+    return golden_df, discards_df
 
-    golden_rows: List[pd.DataFrame] = []
-    discard_rows: List[pd.DataFrame] = []
 
-    for gid, grp in dup_only.groupby("_dup_group_id"):
-        golden_idx = identify_golden_record(grp, strategy)
-        if golden_idx == -1:
-            continue
-        golden_rows.append(grp.loc[[golden_idx]])
-        discard_rows.append(grp.drop(index=golden_idx))
+# ── Memoized entry points (identical input → no recomputation on rerun) ───
 
-    golden_df   = pd.concat([non_dup] + golden_rows,  ignore_index=False) if golden_rows  else non_dup.copy()
-    discards_df = pd.concat(discard_rows, ignore_index=False)              if discard_rows else pd.DataFrame()
+def _df_fingerprint(df: pd.DataFrame) -> str:
+    """Shape + column names + digest of every row (index included).
 
-    return golden_df, discards_df
+    The key feeds process-wide ``st.cache_data`` caches, so it must cover the
+    whole frame; the vectorized row hash is cheap next to profiling/survivorship.
+    """
+    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    digest     = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).hexdigest()
+    return f"{len(df)}:{','.join(map(str, df.columns))}:{digest}"
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_profile(df_fingerprint: str, _df: pd.DataFrame) -> pd.DataFrame:
+    return profile_columns(_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_golden_records(
+    df_fingerprint: str, strategy: str, _dup_df: pd.DataFrame,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    return build_golden_records_df(_dup_df, strategy)
+
+
+def _golden_key(dup_df: pd.DataFrame) -> str:
+    # Survivorship reads every value, so the full-frame fingerprint (annotation
+    # columns included) is the key
+    return _df_fingerprint(dup_df)
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -539,18 +783,38 @@ def build_case_excel(
     return out.getvalue()
 
 
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    CSV-encode ``df``. Multi-column all-text frames go through PyArrow's
+    multi-threaded writer (which quotes every field); anything else uses pandas,
+    so numbers, booleans and dates keep pandas' formatting and a one-column
+    null row stays ``""`` rather than a blank line readers would skip.
+    """
+    if df.shape[1] > 1 and all(pd.api.types.is_string_dtype(t) for t in df.dtypes):
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            schema = pa.schema([(c, pa.string()) for c in df.columns])
+            table  = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            sink   = pa.BufferOutputStream()
+            pacsv.write_csv(table, sink)
+            return sink.getvalue().to_pybytes()
+        except (ImportError, TypeError, ValueError, KeyError, ArithmeticError):
+            pass   # pyarrow missing, or object columns holding non-text values
+    return df.to_csv(index=False).encode("utf-8")
+
+
 # ══════════════════════════════════════════════════════════════════════════
 #  VISUALIZATION HELPERS
 # ══════════════════════════════════════════════════════════════════════════
 
-def _case_status_pie_png(cases: List[dict]) -> Optional[bytes]:
-    if not cases:
+@st.cache_data(show_spinner=False)
+def _status_pie_from_counts(status_counts: Tuple[Tuple[str, int], ...]) -> Optional[bytes]:
+    """Render the status donut from a hashable ``(status, count)`` tuple (memoized across reruns)."""
+    if not status_counts:
         return None
-    status_counts: Dict[str, int] = defaultdict(int)
-    for c in cases:
-        status_counts[c["status"]] += 1
-    labels = list(status_counts.keys())
-    sizes  = list(status_counts.values())
+    labels = [l for l, _ in status_counts]
+    sizes  = [n for _, n in status_counts]
     colors = [STATUS_COLORS.get(l, "#94a3b8") for l in labels]
     fig, ax = plt.subplots(figsize=(4, 4), dpi=140)
     fig.patch.set_facecolor("#fafafa")
@@ -562,7 +826,7 @@ def _case_status_pie_png(cases: List[dict]) -> Optional[bytes]:
     )
     for at in autotexts:
         at.set_fontsize(9); at.set_color("white"); at.set_fontweight("bold")
-    ax.text(0, 0, f"{len(cases)}\nCases", ha="center", va="center",
+    ax.text(0, 0, f"{sum(sizes)}\nCases", ha="center", va="center",
             fontsize=16, fontweight="bold", color="#6d28d9")
     plt.tight_layout()
     buf = BytesIO()
@@ -571,12 +835,12 @@ def _case_status_pie_png(cases: List[dict]) -> Optional[bytes]:
     return buf.getvalue()
 
 
-def _case_priority_bar_png(cases: List[dict]) -> Optional[bytes]:
-    if not cases:
+@st.cache_data(show_spinner=False)
+def _priority_bar_from_counts(prio_counts_items: Tuple[Tuple[str, int], ...]) -> Optional[bytes]:
+    """Render the priority bar chart from a hashable ``(priority, count)`` tuple (memoized)."""
+    prio_counts = dict(prio_counts_items)
+    if not prio_counts:
         return None
-    prio_counts: Dict[str, int] = defaultdict(int)
-    for c in cases:
-        prio_counts[c["priority"]] += 1
     ordered = [p for p in _CASE_PRIORITIES if p in prio_counts]
     sizes  = [prio_counts[p] for p in ordered]
     colors = [PRIORITY_COLORS.get(p, "#94a3b8") for p in ordered]
@@ -602,7 +866,7 @@ def _dup_group_bar_png(dup_df: pd.DataFrame) -> Optional[bytes]:
     if dup_df is None or dup_df.empty:
         return None
     groups = (
-        dup_df[dup_df["_is_duplicate"]]
+        _dup_rows(dup_df)
         .groupby("_dup_group_id").size()
         .sort_values(ascending=False).head(20)
     )
@@ -635,7 +899,7 @@ def _dup_analytics_charts_png(dup_df: pd.DataFrame) -> Dict[str, Optional[bytes]
     if dup_df is None or dup_df.empty:
         return charts
 
-    dup_only = dup_df[dup_df["_is_duplicate"]]
+    dup_only = _dup_rows(dup_df)
 
     # ── Match type distribution ───────────────────────────────────────────
     if "_match_type" in dup_only.columns and not dup_only.empty:
@@ -675,6 +939,47 @@ def _dup_analytics_charts_png(dup_df: pd.DataFrame) -> Dict[str, Optional[bytes]
     return charts
 
 
+def _dup_df_fingerprint(dup_df: pd.DataFrame) -> int:
+    """Cheap content hash of the columns the duplicate charts depend on."""
+    cols = [c for c in ("_is_duplicate", "_dup_group_id", "_match_type", "_similarity_score")
+            if c in dup_df.columns]
+    return int(pd.util.hash_pandas_object(dup_df[cols], index=False).sum())
+
+
+@st.cache_data(show_spinner=False)
+def _cached_dup_analytics_charts(fingerprint: int, _dup_df: pd.DataFrame) -> Dict[str, Optional[bytes]]:
+    """Memoized ``_dup_analytics_charts_png`` keyed on ``_dup_df_fingerprint``."""
+    return _dup_analytics_charts_png(_dup_df)
+
+
+@st.cache_data(show_spinner=False)
+def _cached_dup_group_bar(fingerprint: int, _dup_df: pd.DataFrame) -> Optional[bytes]:
+    """Memoized ``_dup_group_bar_png`` keyed on ``_dup_df_fingerprint``."""
+    return _dup_group_bar_png(_dup_df)
+
+
+@st.cache_data(show_spinner=False)
+def _dup_summary(fingerprint: int, _dup_df: pd.DataFrame) -> Dict[str, Any]:
+    """All duplicate-group metrics from one boolean mask (memoized on ``_dup_df_fingerprint``)."""
+    dup_only = _dup_rows(_dup_df)
+    total    = len(_dup_df)
+    dup      = len(dup_only)
+    n_groups = int(dup_only["_dup_group_id"].nunique())
+    exact = (
+        int((dup_only["_match_type"].to_numpy() == "Exact").sum())
+        if "_match_type" in dup_only.columns else 0
+    )
+    return {
+        "total":     total,
+        "dup":       dup,
+        "groups":    n_groups,
+        "unique":    total - dup,
+        "exact":     exact,
+        "fuzzy":     dup - exact,
+    }
+
+
+@st.cache_data(show_spinner=False)
 def _golden_vs_discard_pie_png(golden_count: int, discard_count: int) -> Optional[bytes]:
     if golden_count == 0 and discard_count == 0:
         return None
@@ -738,24 +1043,19 @@ def page_case_management():
     )
     st.divider()
 
-    tab_dash, tab_cases, tab_studio, tab_golden, tab_reports = st.tabs([
-        "📊 Dashboard",
-        "📋 Cases",
-        "🔬 Dynamic Duplicate Studio",
-        "🏆 Golden Records",
-        "📥 Reports & Export",
-    ])
-
-    with tab_dash:
-        _render_dashboard()
-    with tab_cases:
-        _render_cases_tab()
-    with tab_studio:
-        _render_dynamic_duplicate_studio()
-    with tab_golden:
-        _render_golden_records_tab()
-    with tab_reports:
-        _render_reports_tab()
+    # st.tabs executes every tab body on each rerun; a radio renders only the visible view
+    views = {
+        "📊 Dashboard":                 _render_dashboard,
+        "📋 Cases":                     _render_cases_tab,
+        "🔬 Dynamic Duplicate Studio":  _render_dynamic_duplicate_studio,
+        "🏆 Golden Records":            _render_golden_records_tab,
+        "📥 Reports & Export":          _render_reports_tab,
+    }
+    active = st.radio(
+        "View", list(views.keys()),
+        horizontal=True, label_visibility="collapsed", key="cm_active_tab",
+    )
+    views[active]()
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -779,11 +1079,17 @@ def _render_dashboard():
         """, unsafe_allow_html=True)
         return
 
-    total       = len(cases)
-    open_cnt    = sum(1 for c in cases if c["status"] == "Open")
-    ip_cnt      = sum(1 for c in cases if c["status"] == "In Progress")
-    resolved    = sum(1 for c in cases if c["status"] in ("Resolved", "Closed"))
-    critical    = sum(1 for c in cases if c["priority"] == "Critical" and c["status"] not in ("Resolved", "Closed"))
+    # Status / priority histograms on categorical codes, shared by metrics and charts
+    cases_df    = cases_frame()
+    status_ctr  = cases_df["status"].value_counts(sort=False)
+    prio_ctr    = cases_df["priority"].value_counts(sort=False)
+    active      = ~cases_df["status"].isin(["Resolved", "Closed"])
+
+    total       = len(cases_df)
+    open_cnt    = int(status_ctr.get("Open", 0))
+    ip_cnt      = int(status_ctr.get("In Progress", 0))
+    resolved    = int(status_ctr.get("Resolved", 0) + status_ctr.get("Closed", 0))
+    critical    = int(((cases_df["priority"] == "Critical") & active).sum())
 
     m1, m2, m3, m4, m5 = st.columns(5)
     m1.metric("Total Cases", total)
@@ -800,12 +1106,12 @@ def _render_dashboard():
     c1, c2 = st.columns(2)
     with c1:
         st.markdown("#### Case Status Distribution")
-        img = _case_status_pie_png(cases)
+        img = _status_pie_from_counts(tuple((k, int(v)) for k, v in status_ctr.items() if v))
         if img:
             st.image(img, use_container_width=True)
     with c2:
         st.markdown("#### Cases by Priority")
-        img = _case_priority_bar_png(cases)
+        img = _priority_bar_from_counts(tuple((k, int(v)) for k, v in prio_ctr.items() if v))
         if img:
             st.image(img, use_container_width=True)
 
@@ -813,14 +1119,15 @@ def _render_dashboard():
     if dup_df is not None and not dup_df.empty:
         st.divider()
         st.markdown("#### 🔁 Duplicate Analytics Overview")
-        dup_only = dup_df[dup_df["_is_duplicate"]]
+        fingerprint = _dup_df_fingerprint(dup_df)
+        summary     = _dup_summary(fingerprint, dup_df)
         d1, d2, d3, d4 = st.columns(4)
-        d1.metric("Total Records",     f"{len(dup_df):,}")
-        d2.metric("Duplicate Records", f"{len(dup_only):,}")
-        d3.metric("Duplicate Groups",  f"{dup_only['_dup_group_id'].nunique():,}")
-        d4.metric("Unique Records",    f"{len(dup_df) - len(dup_only):,}")
+        d1.metric("Total Records",     f"{summary['total']:,}")
+        d2.metric("Duplicate Records", f"{summary['dup']:,}")
+        d3.metric("Duplicate Groups",  f"{summary['groups']:,}")
+        d4.metric("Unique Records",    f"{summary['unique']:,}")
 
-        analytics = _dup_analytics_charts_png(dup_df)
+        analytics = _cached_dup_analytics_charts(fingerprint, dup_df)
         if analytics:
             acols = st.columns(len(analytics))
             for i, (key, img) in enumerate(analytics.items()):
@@ -830,14 +1137,11 @@ def _render_dashboard():
 
     st.divider()
     st.markdown("#### Recent Cases")
-    recent = sorted(cases, key=lambda c: c["created_at"], reverse=True)[:10]
-    rows = [{
-        "Case ID": c["case_id"], "Title": c["title"], "Type": c["type"],
-        "Priority": c["priority"], "Status": c["status"],
-        "Records": c["affected_records"], "Created": c["created_at"],
-    } for c in recent]
-    if rows:
-        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    # cases are appended in creation order, so the newest ten are a reverse slice —
+    # O(10) with no sort (cheaper than nlargest on the string timestamp)
+    recent = cases_df.iloc[:-11:-1]
+    if not recent.empty:
+        st.dataframe(_case_table(recent), use_container_width=True, hide_index=True)
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -876,60 +1180,81 @@ def _render_cases_tab():
 
     st.divider()
     st.markdown("### 📋 All Cases")
-    f1, f2, f3 = st.columns(3)
-    filt_status = f1.selectbox("Filter by Status",   ["All"] + _CASE_STATUSES,   key="cm_filt_st")
-    filt_prio   = f2.selectbox("Filter by Priority", ["All"] + _CASE_PRIORITIES, key="cm_filt_pr")
-    filt_type   = f3.selectbox("Filter by Type",     ["All"] + _CASE_TYPES,      key="cm_filt_tp")
-
-    filtered = [c for c in cases
-                if (filt_status == "All" or c["status"] == filt_status)
-                and (filt_prio == "All" or c["priority"] == filt_prio)
-                and (filt_type == "All" or c["type"] == filt_type)]
-
-    if not filtered:
+    with st.form("cm_case_filters", border=False):
+        f1, f2, f3, f4 = st.columns([3, 3, 3, 1])
+        filt_status = f1.selectbox("Filter by Status",   ["All"] + _CASE_STATUSES,   key="cm_filt_st")
+        filt_prio   = f2.selectbox("Filter by Priority", ["All"] + _CASE_PRIORITIES, key="cm_filt_pr")
+        filt_type   = f3.selectbox("Filter by Type",     ["All"] + _CASE_TYPES,      key="cm_filt_tp")
+        with f4:
+            st.markdown("<div style='height:1.6rem'></div>", unsafe_allow_html=True)
+            st.form_submit_button("Apply", use_container_width=True)
+
+    cases_df = cases_frame()
+    mask = np.ones(len(cases_df), dtype=bool)
+    for field, choice in (("status", filt_status), ("priority", filt_prio), ("type", filt_type)):
+        if choice != "All":
+            mask &= _category_mask(cases_df[field], choice)
+    positions = np.flatnonzero(mask)[::-1]   # filtering preserves creation order → newest first
+
+    if positions.size == 0:
         st.info("No cases match the current filters.")
         return
 
-    for case in sorted(filtered, key=lambda c: c["created_at"], reverse=True):
-        label = f"**{case['case_id']}** — {case['title']}  | {case['status']} | {case['priority']}"
-        with st.expander(label, expanded=False):
-            d1, d2, d3, d4 = st.columns(4)
-            d1.markdown(f"**Type:** {case['type']}")
-            d2.markdown(f"**Priority:** {case['priority']}")
-            d3.markdown(f"**Records:** {case['affected_records']}")
-            d4.markdown(f"**Source:** {case['source']}")
-            if case["description"]:
-                st.markdown(f"**Description:** {case['description']}")
-            if case["affected_columns"]:
-                st.markdown(f"**Columns:** {case['affected_columns']}")
-            st.markdown(f"**Created:** {case['created_at']}  |  **Updated:** {case['updated_at']}")
-            if case["resolved_at"]:
-                st.markdown(f"**Resolved:** {case['resolved_at']}")
-            st.markdown("---")
-            u1, u2, u3 = st.columns([1, 1, 1])
-            with u1:
-                new_st = st.selectbox("Update Status", _CASE_STATUSES,
-                                      index=_CASE_STATUSES.index(case["status"]),
-                                      key=f"cm_st_{case['case_id']}")
-            with u2:
-                note = st.text_input("Note", key=f"cm_note_{case['case_id']}")
-            with u3:
-                st.markdown("<div style='height:1.6rem'></div>", unsafe_allow_html=True)
-                if st.button("💾 Update", key=f"cm_upd_{case['case_id']}"):
-                    if new_st != case["status"]:
-                        update_case_status(case["case_id"], new_st, note)
-                        st.success(f"Updated to **{new_st}**")
-                        st.rerun()
-            if case["history"]:
-                st.markdown("**📜 Audit Trail:**")
-                for h in reversed(case["history"]):
-                    st.markdown(
-                        f"<div style='padding:0.3rem 0.8rem;margin:0.2rem 0;"
-                        f"background:#f7f4fc;border-left:3px solid #7c3aed;border-radius:4px;"
-                        f"font-size:0.85rem;'>"
-                        f"<strong>{h['ts']}</strong> — {h['action']} <em>({h['by']})</em>"
-                        f"</div>", unsafe_allow_html=True,
-                    )
+    # One table + one detail panel instead of an expander (and its widgets) per case
+    table = _case_table(cases_df.iloc[positions])
+    event = st.dataframe(
+        table, use_container_width=True, hide_index=True,
+        selection_mode="single-row", on_select="rerun", key="cm_cases_table",
+    )
+    sel_rows = [r for r in event.selection.rows if r < positions.size]
+    if not sel_rows:
+        st.caption("👆 Select a case to view details, update its status and see the audit trail.")
+        return
+
+    case = cases[positions[sel_rows[0]]]
+    with st.container(border=True):
+        st.markdown(f"#### {case['case_id']} — {case['title']}")
+        d1, d2, d3, d4 = st.columns(4)
+        d1.markdown(f"**Type:** {case['type']}")
+        d2.markdown(f"**Priority:** {case['priority']}")
+        d3.markdown(f"**Records:** {case['affected_records']}")
+        d4.markdown(f"**Source:** {case['source']}")
+        if case["description"]:
+            st.markdown(f"**Description:** {case['description']}")
+        if case["affected_columns"]:
+            st.markdown(f"**Columns:** {case['affected_columns']}")
+        st.markdown(f"**Created:** {case['created_at']}  |  **Updated:** {case['updated_at']}")
+        if case["resolved_at"]:
+            st.markdown(f"**Resolved:** {case['resolved_at']}")
+        st.markdown("---")
+        u1, u2, u3 = st.columns([1, 1, 1])
+        with u1:
+            new_st = st.selectbox("Update Status", _CASE_STATUSES,
+                                  index=_CASE_STATUSES.index(case["status"]),
+                                  key=f"cm_st_{case['case_id']}")
+        with u2:
+            note = st.text_input("Note", key=f"cm_note_{case['case_id']}")
+        with u3:
+            st.markdown("<div style='height:1.6rem'></div>", unsafe_allow_html=True)
+            if st.button("💾 Update", key=f"cm_upd_{case['case_id']}"):
+                if new_st != case["status"]:
+                    update_case_status(case["case_id"], new_st, note)
+                    st.success(f"Updated to **{new_st}**")
+                    st.rerun()
+        if case["history"]:
+            st.markdown("**📜 Audit Trail:**")
+            # One element for the whole trail instead of one per history entry
+            st.markdown(
+                "".join(
+                    f"<div style='padding:0.3rem 0.8rem;margin:0.2rem 0;"
+                    f"background:#f7f4fc;border-left:3px solid #7c3aed;border-radius:4px;"
+                    f"font-size:0.85rem;'>"
+                    f"<strong>{h['ts']}</strong> — {h['action']} <em>({h['by']})</em>"
+                    f"</div>"
+                    for h in reversed(case["history"])
+                ),
+                unsafe_allow_html=True,
+            )
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -974,7 +1299,10 @@ def _render_dynamic_duplicate_studio():
         dq_df = st.session_state.get("dq_results_df")
         if dq_df is not None:
             skip = {"Issues", "Count of issues", "Failed_Rules", "Failed_Columns", "Issue categories"}
-            source_df = dq_df[[c for c in dq_df.columns if not c.startswith("_") and c not in skip]].copy()
+            kept_cols = [c for c in dq_df.columns if not c.startswith("_") and c not in skip]
+            # Projection only — profiling/detection never mutate their input, so no defensive copy
+            source_df = dq_df.loc[:, kept_cols]
+            st.session_state["dup_source_cols"] = kept_cols
             st.info(f"✅ Using DQ results: **{len(source_df):,}** records · **{len(source_df.columns)}** columns")
         else:
             st.warning("⚠️ No DQ results available. Upload a file or run a DQ Assessment first.")
@@ -992,7 +1320,7 @@ def _render_dynamic_duplicate_studio():
 
     if st.button("🔍 Profile Columns", key="studio_profile_btn"):
         with st.spinner("Profiling columns…"):
-            profile_df = profile_columns(source_df)
+            profile_df = _cached_profile(_df_fingerprint(source_df), source_df)
             st.session_state["studio_profile"] = profile_df
         st.rerun()
 
@@ -1024,57 +1352,59 @@ def _render_dynamic_duplicate_studio():
     threshold  = 0.85
     match_cols: List[str] = []
 
-    if mode == "Exact (Single Column)":
-        col_choice = st.selectbox("Match Column", all_cols, key="studio_col_single")
-        match_cols = [col_choice]
-        st.caption("Records with identical values in the selected column will be grouped.")
-
-    elif mode == "Exact (Multi-Column Combination)":
-        match_cols = st.multiselect(
-            "Match Columns (all must match)",
-            options=all_cols,
-            default=[],
-            key="studio_col_multi",
-            help="Records matching on ALL selected columns are grouped as duplicates.",
-        )
-        if not match_cols:
-            st.info("👆 Select at least two columns for combination matching.")
-            return
-        st.caption(f"Composite key: {' | '.join(match_cols)}")
-
-    else:  # Fuzzy
-        col_choice = st.selectbox("Match Column (Fuzzy)", all_cols, key="studio_col_fuzzy")
-        match_cols = [col_choice]
-        threshold  = st.slider(
-            "Similarity Threshold", min_value=0.50, max_value=1.00,
-            value=0.85, step=0.01, key="studio_threshold",
-            help="Records with similarity ≥ threshold will be grouped. 1.0 = exact.",
-        )
-        fuzzy = True
-        st.caption(
-            f"Values with ≥ {threshold:.0%} similarity on **{col_choice}** will be grouped. "
-            "Uses SequenceMatcher (character-level ratio)."
-        )
-        if len(source_df) > 5000:
-            st.warning(
-                "⚠️ Fuzzy matching on large datasets can be slow. "
-                "Consider filtering to < 5,000 rows or sampling first."
+    # Column / threshold / survivorship widgets live in a form: adjusting them
+    # doesn't rerun the page (profiling, charts) until the user submits.
+    # The mode radio stays outside because it decides which widgets are shown.
+    with st.form("studio_cfg", border=False):
+        if mode == "Exact (Single Column)":
+            col_choice = st.selectbox("Match Column", all_cols, key="studio_col_single")
+            match_cols = [col_choice]
+            st.caption("Records with identical values in the selected column will be grouped.")
+
+        elif mode == "Exact (Multi-Column Combination)":
+            match_cols = st.multiselect(
+                "Match Columns (all must match)",
+                options=all_cols,
+                default=[],
+                key="studio_col_multi",
+                help="Records matching on ALL selected columns are grouped as duplicates.",
+            )
+            st.caption("Select at least two columns; records are grouped on the composite key.")
+
+        else:  # Fuzzy
+            col_choice = st.selectbox("Match Column (Fuzzy)", all_cols, key="studio_col_fuzzy")
+            match_cols = [col_choice]
+            threshold  = st.slider(
+                "Similarity Threshold", min_value=0.50, max_value=1.00,
+                value=0.85, step=0.01, key="studio_threshold",
+                help="Records with similarity ≥ threshold will be grouped. 1.0 = exact.",
+            )
+            fuzzy = True
+            st.caption(
+                "Values at or above the threshold on the selected column will be grouped. "
+                "Uses RapidFuzz when installed (SequenceMatcher otherwise) — character-level ratio."
             )
+            if len(source_df) > _FUZZY_BLOCKING_MIN_ROWS:
+                st.warning(
+                    f"⚠️ Above {_FUZZY_BLOCKING_MIN_ROWS:,} rows only values sharing their first "
+                    f"{_FUZZY_BLOCK_PREFIX} characters are compared, so fuzzy matches that differ "
+                    "at the very start are not grouped."
+                )
 
-    st.session_state["dup_match_columns"] = match_cols
+        # ── Survivorship rule (select before running) ─────────────────────
+        surv_strategy = st.selectbox(
+            "Survivorship Rule (for auto golden record generation)",
+            _SURVIVORSHIP_RULES, key="studio_surv",
+        )
 
-    # ── Survivorship rule (select before running) ─────────────────────────
-    surv_strategy = st.selectbox(
-        "Survivorship Rule (for auto golden record generation)",
-        _SURVIVORSHIP_RULES, key="studio_surv",
-    )
+        # ── Run ────────────────────────────────────────────────────────────
+        st.divider()
+        _, col_btn, _ = st.columns([1, 1, 1])
+        with col_btn:
+            run_btn = st.form_submit_button("🚀 Run Duplicate Detection", type="primary",
+                                            use_container_width=True)
 
-    # ── Run ────────────────────────────────────────────────────────────────
-    st.divider()
-    _, col_btn, _ = st.columns([1, 1, 1])
-    with col_btn:
-        run_btn = st.button("🚀 Run Duplicate Detection", type="primary",
-                            use_container_width=True, key="studio_run")
+    st.session_state["dup_match_columns"] = match_cols
 
     if run_btn:
         if not match_cols:
@@ -1083,8 +1413,8 @@ def _render_dynamic_duplicate_studio():
         with st.spinner("Detecting duplicates…"):
             dup_df = detect_duplicates(source_df, match_cols, fuzzy=fuzzy, threshold=threshold)
             st.session_state["dup_groups"] = dup_df
-            dup_count  = int(dup_df["_is_duplicate"].sum())
-            grp_count  = dup_df[dup_df["_is_duplicate"]]["_dup_group_id"].nunique() if dup_count else 0
+            _sorted_group_ids(dup_df)   # computed once here, shared by the studio and golden tabs
+            dup_count  = len(_dup_only(dup_df))
             match_type = "Fuzzy" if fuzzy else "Exact"
 
             # Auto-create cases for each group
@@ -1092,8 +1422,9 @@ def _render_dynamic_duplicate_studio():
 
             # Auto golden records
             if dup_count > 0:
-                golden_df, discards_df = build_golden_records_df(dup_df, surv_strategy)
+                golden_df, discards_df = _cached_golden_records(_golden_key(dup_df), surv_strategy, dup_df)
                 st.session_state["cm_golden_df"]   = golden_df
+                st.session_state["cm_golden_index"] = golden_df.index.to_numpy()
                 st.session_state["cm_discards_df"] = discards_df
 
         st.rerun()
@@ -1103,9 +1434,10 @@ def _render_dynamic_duplicate_studio():
     if dup_df is None or dup_df.empty:
         return
 
-    dup_only  = dup_df[dup_df["_is_duplicate"]]
-    dup_count = len(dup_only)
-    grp_count = dup_only["_dup_group_id"].nunique() if dup_count > 0 else 0
+    fingerprint = _dup_df_fingerprint(dup_df)
+    summary     = _dup_summary(fingerprint, dup_df)
+    dup_count   = summary["dup"]
+    grp_count   = summary["groups"]
 
     st.divider()
 
@@ -1117,9 +1449,7 @@ def _render_dynamic_duplicate_studio():
     m2.metric("Duplicate Records", f"{dup_count:,}")
     m3.metric("Duplicate Groups",  f"{grp_count:,}")
     m4.metric("Unique Records",    f"{len(dup_df) - dup_count:,}")
-    exact_cnt = int((dup_only.get("_match_type", pd.Series(dtype=str)) == "Exact").sum()) if "_match_type" in dup_only.columns else 0
-    fuzzy_cnt = dup_count - exact_cnt
-    m5.metric("Fuzzy Matches",     f"{fuzzy_cnt:,}")
+    m5.metric("Fuzzy Matches",     f"{summary['fuzzy']:,}")
 
     if dup_count == 0:
         st.success("🎉 No duplicates found! All records are unique on the selected configuration.")
@@ -1130,8 +1460,8 @@ def _render_dynamic_duplicate_studio():
     )
 
     # Analytics charts
-    analytics = _dup_analytics_charts_png(dup_df)
-    bar_img   = _dup_group_bar_png(dup_df)
+    analytics   = _cached_dup_analytics_charts(fingerprint, dup_df)
+    bar_img     = _cached_dup_group_bar(fingerprint, dup_df)
     chart_imgs = {k: v for k, v in analytics.items() if v}
     if bar_img:
         chart_imgs["group_bar"] = bar_img
@@ -1149,28 +1479,28 @@ def _render_dynamic_duplicate_studio():
 
     # Most duplicated columns (inferred from match_columns in cases)
     st.divider()
-    dup_cases = [c for c in st.session_state["cases"]
-                 if c.get("type") == "Duplicate Records" and c.get("source") == "Dynamic Duplicate Studio"]
-    if dup_cases:
-        col_freq: Dict[str, int] = defaultdict(int)
-        for c in dup_cases:
-            for col in c.get("affected_columns", "").split(","):
-                col = col.strip()
-                if col:
-                    col_freq[col] += 1
-        if col_freq:
+    cases_df  = cases_frame()
+    dup_cases = cases_df.loc[
+        _category_mask(cases_df["type"], "Duplicate Records")
+        & (cases_df["source"] == "Dynamic Duplicate Studio").to_numpy(),
+        "affected_columns",
+    ]
+    if not dup_cases.empty:
+        col_df = (
+            dup_cases.str.split(",").explode().str.strip()
+            .loc[lambda x: x.notna() & x.ne("")]
+            .value_counts()
+            .rename_axis("Column")
+            .reset_index(name="Groups involving this column")
+        )
+        if not col_df.empty:
             st.markdown("##### Most Duplicated Columns")
-            col_df = pd.DataFrame(
-                sorted(col_freq.items(), key=lambda x: x[1], reverse=True),
-                columns=["Column", "Groups involving this column"],
-            )
             st.dataframe(col_df, use_container_width=True, hide_index=True)
 
     # ── Browse groups ──────────────────────────────────────────────────────
     st.divider()
     st.markdown("### 📋 Browse Duplicate Groups")
-    group_ids = sorted(dup_only["_dup_group_id"].unique())
-    sel_grp   = st.selectbox("Select Duplicate Group", group_ids, key="studio_sel_grp")
+    sel_grp   = st.selectbox("Select Duplicate Group", _sorted_group_ids(dup_df), key="studio_sel_grp")
 
     if sel_grp:
         grp = dup_df[dup_df["_dup_group_id"] == sel_grp]
@@ -1179,11 +1509,11 @@ def _render_dynamic_duplicate_studio():
         ]
         display_cols = [c for c in display_cols if c in grp.columns]
         st.markdown(f"**Group {sel_grp}** — {len(grp)} records")
-        styled = grp[display_cols].style.background_gradient(
-            subset=["_completeness"] if "_completeness" in grp.columns else [],
-            cmap="Greens", vmin=0, vmax=100,
+        # Completeness bar is drawn client-side — no per-cell CSS from a Styler
+        st.dataframe(
+            grp[display_cols], use_container_width=True, hide_index=True,
+            column_config={"_completeness": _COMPLETENESS_COLUMN},
         )
-        st.dataframe(styled, use_container_width=True, hide_index=True)
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -1221,8 +1551,9 @@ def _render_golden_records_tab():
 
     if run_golden:
         with st.spinner("Identifying golden records…"):
-            golden_df, discards_df = build_golden_records_df(dup_df, strategy)
+            golden_df, discards_df = _cached_golden_records(_golden_key(dup_df), strategy, dup_df)
             st.session_state["cm_golden_df"]   = golden_df
+            st.session_state["cm_golden_index"] = golden_df.index.to_numpy()
             st.session_state["cm_discards_df"] = discards_df
             st.rerun()
 
@@ -1234,12 +1565,12 @@ def _render_golden_records_tab():
 
     st.divider()
     st.markdown("### 📊 Golden Record Results")
-    dup_only  = dup_df[dup_df["_is_duplicate"]]
-    n_groups  = dup_only["_dup_group_id"].nunique()
+    summary   = _dup_summary(_dup_df_fingerprint(dup_df), dup_df)
+    n_groups  = summary["groups"]
     n_discards= len(discards_df) if discards_df is not None else 0
 
     m1, m2, m3, m4 = st.columns(4)
-    m1.metric("Duplicate Records", f"{len(dup_only):,}")
+    m1.metric("Duplicate Records", f"{summary['dup']:,}")
     m2.metric("Golden Records",    f"{n_groups:,}")
     m3.metric("Records Discarded", f"{n_discards:,}")
     m4.metric("Final Clean Dataset", f"{len(golden_df):,}")
@@ -1281,25 +1612,31 @@ def _render_golden_records_tab():
 
     st.divider()
     st.markdown("### 🔬 Group-by-Group Comparison")
-    group_ids = sorted(dup_only["_dup_group_id"].unique())
-    sel_grp   = st.selectbox("Select Duplicate Group", group_ids, key="cm_golden_grp")
+    sel_grp   = st.selectbox("Select Duplicate Group", _sorted_group_ids(dup_df), key="cm_golden_grp")
 
     if sel_grp:
-        grp = dup_df[dup_df["_dup_group_id"] == sel_grp].copy()
-        grp["_is_golden"] = grp.index.isin(set(golden_df.index))
+        golden_index = st.session_state.get("cm_golden_index")
+        if golden_index is None:
+            golden_index = golden_df.index.to_numpy()
+            st.session_state["cm_golden_index"] = golden_index
+        idxs = np.flatnonzero(dup_df["_dup_group_id"].to_numpy() == sel_grp)
+        # assign() on the row slice adds the flag without copying dup_df up front
+        grp = dup_df.iloc[idxs].assign(
+            _is_golden=np.isin(dup_df.index.to_numpy()[idxs], golden_index)
+        )
         display_cols = [c for c in grp.columns if not c.startswith("_") or c in ("_completeness", "_is_golden")]
-        display_cols = [c for c in display_cols if c in grp.columns]
         st.markdown(f"**Group {sel_grp}** — {len(grp)} records")
 
-        def _highlight_golden(row):
-            base = ["background-color: #dcfce7; font-weight: bold"] if row.get("_is_golden") else ["background-color: #fee2e2; opacity: 0.7"]
-            return base * len(row)
-
-        styled = grp[display_cols].style.apply(_highlight_golden, axis=1)
-        st.dataframe(styled, use_container_width=True, hide_index=True)
+        st.dataframe(
+            grp[display_cols], use_container_width=True, hide_index=True,
+            column_config={
+                "_is_golden":    st.column_config.CheckboxColumn("🏆 Golden"),
+                "_completeness": _COMPLETENESS_COLUMN,
+            },
+        )
         st.markdown(
             '<div style="font-size:0.82rem;color:#57534e;">'
-            '🟢 <strong>Green</strong> = Golden Record &nbsp;|&nbsp; 🔴 <strong>Red</strong> = Discarded</div>',
+            '☑️ <strong>Golden</strong> = surviving record &nbsp;|&nbsp; ☐ = Discarded</div>',
             unsafe_allow_html=True,
         )
 
@@ -1333,43 +1670,29 @@ def _render_reports_tab():
         return
 
     st.divider()
-    _, col_btn, _ = st.columns([1, 1, 1])
-    with col_btn:
-        gen = st.button("📊 Generate Excel Report", type="primary", use_container_width=True, key="cm_gen_xl")
-
-    if gen:
-        with st.spinner("Building Excel report…"):
-            xl_bytes = build_case_excel(cases, dup_df, golden_df, discards_df)
-            st.session_state["cm_excel_bytes"] = xl_bytes
-            st.rerun()
-
-    xl_bytes = st.session_state.get("cm_excel_bytes")
-    if xl_bytes:
-        ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        st.download_button(
-            "📥 Download Case Management Report",
-            data=xl_bytes,
-            file_name=f"Case_Management_Report_{ts}.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            use_container_width=True, key="cm_dl_xl",
-        )
-        UIComponents.render_hint_chip(
-            "Multi-sheet workbook",
-            tip="Includes: Case Summary, Duplicate Groups, Golden Records, Discards",
-            icon="📊",
-        )
+    # Built only when the user clicks — the workbook is never held in session state
+    ts = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    st.download_button(
+        "📥 Download Case Management Report",
+        data=lambda: build_case_excel(cases, dup_df, golden_df, discards_df),
+        file_name=f"Case_Management_Report_{ts}.xlsx",
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        use_container_width=True, key="cm_dl_xl",
+    )
+    UIComponents.render_hint_chip(
+        "Multi-sheet workbook",
+        tip="Includes: Case Summary, Duplicate Groups, Golden Records, Discards",
+        icon="📊",
+    )
 
     st.divider()
 
     if golden_df is not None and not golden_df.empty:
         st.markdown("#### 🏆 Download Clean Golden Dataset")
         display_cols = [c for c in golden_df.columns if not c.startswith("_")]
-        csv_buf = BytesIO()
-        golden_df[display_cols].to_csv(csv_buf, index=False)
-        csv_buf.seek(0)
         st.download_button(
             "📄 Download Golden Records (CSV)",
-            data=csv_buf.getvalue(),
+            data=lambda: _csv_bytes(golden_df[display_cols]),
             file_name=f"Golden_Records_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv", use_container_width=True, key="cm_dl_golden_csv",
         )
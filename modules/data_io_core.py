@@ -11,26 +11,146 @@ Contains:
 """
 
 import os
+import codecs
 import gc
 import json
 import shutil
 import time
 import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List, Iterator
 
 import pandas as pd
 import numpy as np
 
 from modules.config import AppConfig
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
+
+try:
+    from pandas._libs.parsers import STR_NA_VALUES
+except ImportError:     # private location; mirror pandas' default NA strings
+    STR_NA_VALUES = {
+        "-1.#IND", "1.#QNAN", "1.#IND", "-1.#QNAN", "#N/A N/A", "#N/A", "N/A", "n/a",
+        "NA", "<NA>", "#NA", "NULL", "null", "NaN", "-NaN", "nan", "-nan", "None", "",
+    }
+
+# Strings read as missing by the Arrow CSV path — the same set pd.read_csv uses
+_CSV_NA_VALUES = sorted(STR_NA_VALUES)
+
+
+def _json_loads(raw):
+    """orjson when available; stdlib json for the inputs orjson rejects (NaN literals…)."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
 
 # ══════════════════════════════════════════════════════════════════════════
 #  FILE LOADER SERVICE
 # ══════════════════════════════════════════════════════════════════════════
 
+def _wait_for_readable(path: Path, timeout: float = 1.0) -> None:
+    """
+    Return as soon as the file can be opened and read (an upload still being
+    flushed, or locked by another process on Windows). Backs off from 1 ms, so a
+    ready file costs one open() instead of a fixed sleep; gives up quietly after
+    ``timeout`` and lets the real read surface the error.
+    """
+    deadline = time.monotonic() + timeout
+    delay    = 0.001
+    while True:
+        try:
+            with open(path, "rb") as f:
+                f.read(4)
+            return
+        except OSError:
+            if time.monotonic() + delay > deadline:
+                return
+            time.sleep(delay)
+            delay *= 2
+
+
+@dataclass(frozen=True)
+class _FileMeta:
+    """Path facts gathered once at the public API boundary (one ``stat`` call)."""
+    path:     Path
+    ext:      str
+    size:     int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: Path, ext: str) -> "_FileMeta":
+        st = os.stat(path)
+        return cls(path, ext, st.st_size, st.st_mtime_ns)
+
+
+_SNIFF_BYTES = 64 << 10
+
+# Legacy code pages CSV exports realistically arrive in; keeps charset-normalizer
+# from "detecting" exotic DOS/Mac pages on short samples
+_SNIFF_CANDIDATES = [
+    "cp1252", "cp1250", "cp1251", "cp1253", "cp1254", "cp1255", "cp1256", "cp1257",
+    "shift_jis", "gb18030", "big5", "euc_kr",
+]
+
+
+def _sniff_encoding(file_path: Path) -> str:
+    """
+    Text encoding guessed from the first 64 KB, so a non-UTF-8 CSV is parsed once
+    with the right codec instead of failing a full UTF-8 pass first. UTF-8 (and
+    plain ASCII) is confirmed directly; otherwise charset-normalizer's guess is
+    used when it recognised a language, then cp1252, then latin-1 (never fails).
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(_SNIFF_BYTES)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)   # tolerate a cut multibyte tail
+        return "utf-8"
+    except UnicodeDecodeError:
+        pass
+    if charset_normalizer is not None:
+        best = charset_normalizer.from_bytes(head, cp_isolation=_SNIFF_CANDIDATES).best()
+        if best is not None and best.coherence > 0:
+            return codecs.lookup(best.encoding).name
+    try:
+        head.decode("cp1252")
+        return "cp1252"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def _excel_engine() -> str:
+    """Rust-backed calamine reader when python-calamine is installed, else openpyxl."""
+    try:
+        import python_calamine  # noqa: F401
+        return "calamine"
+    except ImportError:
+        return "openpyxl"
+
+
 class FileLoaderService:
     """Universal loader supporting CSV, TSV, Excel variants, JSON, Parquet, ODS, XML."""
 
@@ -44,8 +164,9 @@ class FileLoaderService:
         ".xml",
     ]
 
-    def __init__(self):
+    def __init__(self, dictionary_encode: bool = False):
         self.supported_formats = self.SUPPORTED
+        self.dictionary_encode = dictionary_encode
 
     # ── Public API ────────────────────────────────────────────────────────
 
@@ -55,51 +176,130 @@ class FileLoaderService:
         sheet_name: Optional[str] = None,
         columns:    Optional[List[str]] = None,
     ) -> pd.DataFrame:
+        """
+        Load a file into a DataFrame. Parsed results are memoized on
+        (path, mtime, size, sheet, columns), so reopening an unchanged file across
+        reruns is free; callers receive a copy so the cached frame can't be mutated.
+        """
         file_path = Path(file_path)
         ext = file_path.suffix.lower()
         if ext not in self.SUPPORTED:
             raise ValueError(f"Unsupported format: '{ext}'. Supported: {', '.join(self.SUPPORTED)}")
+        try:
+            meta = _FileMeta.of(file_path.resolve(), ext)
+        except OSError as e:
+            raise Exception(f"Error loading '{file_path.name}': {str(e)}")
+        return _cached_load(meta, sheet_name, tuple(columns or ()), self.dictionary_encode).copy()
 
+    def _load_dataframe_uncached(
+        self,
+        meta:       _FileMeta,
+        sheet_name: Optional[str] = None,
+        columns:    Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        file_path, ext = meta.path, meta.ext
         try:
             if ext in (".csv", ".tsv"):
-                df = self._load_csv(file_path, ext)
+                df = self._load_csv(file_path, ext, columns)
             elif ext in (".xlsx", ".xls", ".xlsm"):
-                df = self._load_excel_openpyxl(file_path, sheet_name)
+                df = self._load_excel(file_path, sheet_name, columns=columns, size=meta.size)
             elif ext == ".xlsb":
-                df = self._load_xlsb(file_path, sheet_name)
+                df = self._load_xlsb(file_path, sheet_name, columns=columns)
             elif ext == ".ods":
-                df = self._load_ods(file_path, sheet_name)
+                df = self._load_ods(file_path, sheet_name, columns)
             elif ext == ".json":
                 df = self._load_json(file_path)
             elif ext == ".parquet":
-                df = self._load_parquet(file_path)
+                df = self._load_parquet(file_path, columns)
             elif ext == ".xml":
                 df = self._load_xml(file_path)
             else:
                 raise ValueError(f"Unhandled type: {ext}")
 
             df = self._normalize_dataframe(df)
+            # Loaders already projected where they can; this validates and orders
             if columns:
                 missing = [c for c in columns if c not in df.columns]
                 if missing:
                     raise ValueError(f"Columns not found: {missing}")
                 df = df[columns]
+            # Parquet string columns already come from dictionary pages — don't re-encode
+            if self.dictionary_encode and ext != ".parquet":
+                df = _dictionary_encode(df)
             return df
         except Exception as e:
             raise Exception(f"Error loading '{file_path.name}': {str(e)}")
 
+    def iter_dataframe(
+        self,
+        file_path: Path,
+        chunksize:  int = 100_000,
+        sheet_name: Optional[str] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Yield the file as successive DataFrames of at most ``chunksize`` rows so
+        callers can scan files larger than memory. CSV/TSV, Parquet, xlsx/xlsm and
+        xlsb are streamed; other formats are loaded once and sliced.
+        """
+        file_path = Path(file_path)
+        ext = file_path.suffix.lower()
+        if ext not in self.SUPPORTED:
+            raise ValueError(f"Unsupported format: '{ext}'. Supported: {', '.join(self.SUPPORTED)}")
+
+        if ext in (".csv", ".tsv"):
+            chunks = self._iter_csv(file_path, ext, chunksize)
+        elif ext == ".parquet":
+            chunks = self._iter_parquet(file_path, chunksize)
+        elif ext in (".xlsx", ".xlsm"):
+            chunks = self._iter_excel_rows(file_path, sheet_name, chunksize)
+        elif ext == ".xlsb":
+            chunks = self._iter_xlsb(file_path, sheet_name, chunksize)
+        else:
+            df = self.load_dataframe(file_path, sheet_name)
+            chunks = (df.iloc[i:i + chunksize] for i in range(0, len(df), chunksize))
+            yield from chunks
+            return
+
+        for chunk in chunks:
+            yield self._normalize_dataframe(chunk)
+
+    def load_many(
+        self,
+        paths:       List[Path],
+        max_workers: Optional[int] = None,
+    ) -> Dict[Path, pd.DataFrame]:
+        """
+        Load several files in parallel worker processes (parsing is CPU-bound, so
+        processes rather than threads). Results are keyed by the given path.
+        """
+        paths   = [Path(p) for p in paths]
+        workers = min(max_workers or os.cpu_count() or 1, len(paths))
+        if workers <= 1:
+            return {p: self.load_dataframe(p) for p in paths}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            frames = pool.map(_load_one_worker, paths, [self.dictionary_encode] * len(paths))
+            return dict(zip(paths, frames))
+
     def get_sheet_names(self, file_path: Path) -> List[str]:
         file_path = Path(file_path)
         ext = file_path.suffix.lower()
         if ext not in (".xlsx", ".xls", ".xlsm", ".xlsb", ".ods"):
             return []
         try:
-            time.sleep(0.1)
+            meta = _FileMeta.of(file_path.resolve(), ext)
+        except OSError as e:
+            raise ValueError(f"Cannot read file: {str(e)}")
+        return list(_cached_sheet_names(meta))
+
+    def _get_sheet_names_uncached(self, meta: _FileMeta) -> List[str]:
+        file_path, ext = meta.path, meta.ext
+        try:
+            _wait_for_readable(file_path)
             if ext == ".xlsb":
                 return self._get_xlsb_sheet_names(file_path)
             if ext == ".ods":
                 return pd.ExcelFile(file_path, engine="odf").sheet_names
-            return pd.ExcelFile(file_path, engine="openpyxl").sheet_names
+            return pd.ExcelFile(file_path, engine=_excel_engine()).sheet_names
         except (EOFError, zipfile.BadZipFile):
             raise ValueError("Excel file is corrupted or incomplete.")
         except Exception as e:
@@ -109,49 +309,113 @@ class FileLoaderService:
         try:
             file_path = Path(file_path)
             ext = file_path.suffix.lower()
-            if ext not in self.SUPPORTED or file_path.stat().st_size == 0:
+            if ext not in self.SUPPORTED or os.stat(file_path).st_size == 0:
                 return False
             if ext in (".csv", ".tsv"):
                 pd.read_csv(file_path, sep="\t" if ext == ".tsv" else ",", nrows=1)
             elif ext in (".xlsx", ".xls", ".xlsm"):
-                pd.read_excel(file_path, nrows=1, engine="openpyxl")
+                pd.read_excel(file_path, nrows=1, engine=_excel_engine())
             elif ext == ".xlsb":
                 self._load_xlsb(file_path, nrows=1)
             elif ext == ".ods":
                 pd.read_excel(file_path, nrows=1, engine="odf")
             elif ext == ".json":
-                with open(file_path) as f:
-                    json.load(f)
+                return self._json_head_byte(file_path) in (b"[", b"{")
             elif ext == ".parquet":
-                pd.read_parquet(file_path).head(1)
+                import pyarrow.parquet as pq
+                pq.ParquetFile(str(file_path)).metadata   # footer only — no row groups decoded
             elif ext == ".xml":
-                pd.read_xml(file_path).head(1)
+                next(ET.iterparse(str(file_path), events=("start",)))   # root tag only
             return True
         except Exception:
             return False
 
+    @staticmethod
+    def _json_head_byte(file_path: Path) -> bytes:
+        """First non-whitespace byte of the file (after an optional UTF-8 BOM)."""
+        with open(file_path, "rb") as f:
+            head = f.read(4096)
+            while head:
+                stripped = head.lstrip(b"\xef\xbb\xbf \t\r\n")
+                if stripped:
+                    return stripped[:1]
+                head = f.read(4096)
+        return b""
+
     # ── Private loaders ───────────────────────────────────────────────────
 
-    def _load_csv(self, file_path: Path, ext: str) -> pd.DataFrame:
+    def _load_csv(self, file_path: Path, ext: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
         sep = "\t" if ext == ".tsv" else ","
+        encoding = _sniff_encoding(file_path)
+        for enc in dict.fromkeys((encoding, "latin-1")):
+            df = self._load_csv_arrow(file_path, sep, enc, columns)
+            if df is not None:
+                return df
+        usecols = _usecols(columns)
         try:
-            return pd.read_csv(file_path, sep=sep, dtype=str, low_memory=False, encoding="utf-8")
+            return pd.read_csv(file_path, sep=sep, dtype=str, low_memory=False, encoding=encoding, usecols=usecols)
         except UnicodeDecodeError:
-            return pd.read_csv(file_path, sep=sep, dtype=str, low_memory=False, encoding="latin-1")
+            return pd.read_csv(file_path, sep=sep, dtype=str, low_memory=False, encoding="latin-1", usecols=usecols)
 
-    def _load_excel_openpyxl(
-        self, file_path: Path, sheet_name: Optional[str], nrows: Optional[int] = None
+    @staticmethod
+    def _load_csv_arrow(
+        file_path: Path, sep: str, encoding: str, columns: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Multi-threaded PyArrow CSV parse into Arrow string columns (every column
+        typed as text, like ``dtype=str``). Returns None when pyarrow is missing or
+        the file needs pandas' more lenient parser (bad encoding, duplicate or
+        blank headers, which pandas names ``Unnamed: N``…).
+        """
+        try:
+            import csv
+            import pyarrow as pa
+            import pyarrow.csv as pcsv
+        except ImportError:
+            return None
+        try:
+            header_enc = "utf-8-sig" if encoding == "utf-8" else encoding   # Arrow skips the BOM too
+            with open(file_path, newline="", encoding=header_enc) as f:
+                header = next(csv.reader(f, delimiter=sep), [])
+            if not header or len(set(header)) != len(header) or not all(h.strip() for h in header):
+                return None
+            if columns:
+                wanted = set(columns)
+                header = [h for h in header if h.strip() in wanted]
+            tbl = pcsv.read_csv(
+                str(file_path),
+                read_options=pcsv.ReadOptions(encoding="utf8" if encoding == "utf-8" else encoding, block_size=16 << 20),
+                parse_options=pcsv.ParseOptions(delimiter=sep),
+                convert_options=pcsv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    include_columns=header if columns else None,
+                    null_values=_CSV_NA_VALUES,
+                    strings_can_be_null=True,
+                ),
+            )
+        except (UnicodeDecodeError, pa.ArrowInvalid, OSError):
+            return None
+        return tbl.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+
+    def _load_excel(
+        self,
+        file_path:  Path,
+        sheet_name: Optional[str],
+        nrows:      Optional[int] = None,
+        columns:    Optional[List[str]] = None,
+        size:       Optional[int] = None,
     ) -> pd.DataFrame:
+        if (os.stat(file_path).st_size if size is None else size) == 0:
+            raise ValueError("Excel file is empty.")
         max_retries, delay = 3, 0.2
+        engine = _excel_engine()
         for attempt in range(max_retries):
             try:
-                if file_path.stat().st_size == 0:
-                    raise ValueError("Excel file is empty.")
                 if attempt == 0:
-                    time.sleep(0.1)
-                xls   = pd.ExcelFile(file_path, engine="openpyxl")
+                    _wait_for_readable(file_path)
+                xls   = pd.ExcelFile(file_path, engine=engine)
                 sheet = sheet_name if (sheet_name and sheet_name in xls.sheet_names) else xls.sheet_names[0]
-                kwargs = {"sheet_name": sheet, "dtype": str}
+                kwargs = {"sheet_name": sheet, "dtype": str, "usecols": _usecols(columns)}
                 if nrows is not None:
                     kwargs["nrows"] = nrows
                 return pd.read_excel(xls, **kwargs)
@@ -159,9 +423,21 @@ class FileLoaderService:
                 if attempt < max_retries - 1:
                     time.sleep(delay); delay *= 2; continue
                 raise ValueError("Excel file appears corrupted or incomplete.")
+            except Exception:
+                # Workbooks calamine cannot parse are retried once with openpyxl
+                if engine == "openpyxl" or attempt == max_retries - 1:
+                    raise
+                engine = "openpyxl"
+
+    # Backward-compatible name
+    _load_excel_openpyxl = _load_excel
 
     def _load_xlsb(
-        self, file_path: Path, sheet_name: Optional[str] = None, nrows: Optional[int] = None
+        self,
+        file_path:  Path,
+        sheet_name: Optional[str] = None,
+        nrows:      Optional[int] = None,
+        columns:    Optional[List[str]] = None,
     ) -> pd.DataFrame:
         try:
             import pyxlsb
@@ -173,20 +449,73 @@ class FileLoaderService:
             if not sheets:
                 raise ValueError("No sheets found in .xlsb workbook.")
             target = sheet_name if (sheet_name and sheet_name in sheets) else sheets[0]
-            rows_data: List[list] = []
             with wb.get_sheet(target) as sheet:
-                for row_idx, row in enumerate(sheet.rows()):
-                    rows_data.append([cell.v for cell in row])
-                    if nrows is not None and row_idx >= nrows:
-                        break
-
-        if not rows_data:
-            return pd.DataFrame()
-        headers = [str(h).strip() if h is not None else f"Column_{i}" for i, h in enumerate(rows_data[0])]
-        df = pd.DataFrame(rows_data[1:], columns=headers)
-        df = df.applymap(lambda x: str(x) if x is not None else None)
+                rows = iter(sheet.rows())
+                header = next(rows, None)
+                if header is None:
+                    return pd.DataFrame()
+                headers = [str(c.v).strip() if c.v is not None else f"Column_{i}"
+                           for i, c in enumerate(header)]
+                keep = None
+                if columns:
+                    wanted = set(columns)
+                    keep   = [i for i, h in enumerate(headers) if h in wanted]
+                try:
+                    import pyarrow as pa
+                except ImportError:
+                    df = self._xlsb_rows_to_matrix(rows, headers, nrows)
+                    return df if keep is None else df.iloc[:, keep]
+                return self._xlsb_rows_to_arrow(rows, headers, nrows, pa, keep)
+
+    @staticmethod
+    def _xlsb_rows_to_arrow(
+        rows, headers: List[str], nrows: Optional[int], pa, keep: Optional[List[int]] = None
+    ) -> pd.DataFrame:
+        """
+        Column-wise build: each cell goes straight onto its column's list, and each
+        column becomes one contiguous Arrow string array — no row objects and no
+        pandas row→column transpose. ``keep`` restricts the build to those column
+        positions.
+        """
+        picks   = list(range(len(headers))) if keep is None else keep
+        cols    = [[] for _ in picks]
+        pairs   = list(zip([c.append for c in cols], picks))
+        filled  = 0
+        for row in rows:
+            if nrows is not None and filled >= nrows:
+                break
+            n = len(row)
+            for append, j in pairs:
+                v = row[j].v if j < n else None
+                append(None if v is None else (v if isinstance(v, str) else str(v)))
+            filled += 1
+        tbl = pa.Table.from_arrays([pa.array(c, type=pa.string()) for c in cols],
+                                   names=[str(j) for j in picks])
+        del cols, pairs
+        df = tbl.to_pandas(self_destruct=True, types_mapper=pd.ArrowDtype)
+        df.columns = [headers[j] for j in picks]   # may contain duplicates
         return df
 
+    @staticmethod
+    def _xlsb_rows_to_matrix(rows, headers: List[str], nrows: Optional[int]) -> pd.DataFrame:
+        width = len(headers)
+        # Cells are stringified straight into one object matrix (grown
+        # geometrically) — no intermediate row lists and no applymap pass
+        arr    = np.empty((1024 if nrows is None else max(nrows, 1), width), dtype=object)
+        filled = 0
+        for row in rows:
+            if nrows is not None and filled >= nrows:
+                break
+            if filled == arr.shape[0]:
+                grown = np.empty((arr.shape[0] * 2, width), dtype=object)
+                grown[:filled] = arr
+                arr = grown
+            vals = [None if c.v is None else (c.v if isinstance(c.v, str) else str(c.v))
+                    for c in row[:width]]
+            arr[filled, :len(vals)] = vals
+            filled += 1
+        return pd.DataFrame(arr[:filled], columns=headers, copy=False)
+
     def _get_xlsb_sheet_names(self, file_path: Path) -> List[str]:
         try:
             import pyxlsb
@@ -195,40 +524,301 @@ class FileLoaderService:
         with pyxlsb.open_workbook(str(file_path)) as wb:
             return list(wb.sheets)
 
-    def _load_ods(self, file_path: Path, sheet_name: Optional[str] = None) -> pd.DataFrame:
+    def _load_ods(
+        self, file_path: Path, sheet_name: Optional[str] = None, columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         try:
             import odf  # noqa: F401
         except ImportError:
             raise ImportError("odfpy is required for .ods files: pip install odfpy")
         xls   = pd.ExcelFile(file_path, engine="odf")
         sheet = sheet_name if (sheet_name and sheet_name in xls.sheet_names) else xls.sheet_names[0]
-        return pd.read_excel(xls, sheet_name=sheet, dtype=str)
+        return pd.read_excel(xls, sheet_name=sheet, dtype=str, usecols=_usecols(columns))
 
     def _load_json(self, file_path: Path) -> pd.DataFrame:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        if self._is_ndjson(file_path):
+            df = self._load_ndjson_arrow(file_path)
+            if df is not None:
+                return df
+        if self._json_head_byte(file_path) == b"[" and ijson is not None:
+            df = self._load_json_array_stream(file_path)
+            if df is not None:
+                return df
+        with open(file_path, "rb") as f:
+            data = _json_loads(f.read())
         if isinstance(data, list):
-            return pd.DataFrame(data)
+            return _records_to_frame(data)
         if isinstance(data, dict):
-            return pd.DataFrame(data.get("data", [data]))
+            return _records_to_frame(data.get("data", [data]))
         raise ValueError("JSON must be a list or dict.")
 
-    def _load_parquet(self, file_path: Path) -> pd.DataFrame:
+    @staticmethod
+    def _is_ndjson(file_path: Path) -> bool:
+        """One JSON object per line: the first line parses on its own and more follow."""
+        with open(file_path, "r", encoding="utf-8-sig") as f:
+            first = f.readline()
+            if not first.lstrip().startswith("{"):
+                return False
+            try:
+                if not isinstance(_json_loads(first), dict):
+                    return False
+            except ValueError:
+                return False
+            return any(line.strip() for line in iter(lambda: f.readline(1024), ""))
+
+    @staticmethod
+    def _load_ndjson_arrow(file_path: Path) -> Optional[pd.DataFrame]:
         try:
-            return pd.read_parquet(file_path).astype(str)
+            import pyarrow as pa
+            import pyarrow.json as pajson
+        except ImportError:
+            return None
+        try:
+            tbl = pajson.read_json(str(file_path))
+        except (pa.ArrowInvalid, OSError):
+            return None
+        return tbl.to_pandas(self_destruct=True, types_mapper=pd.ArrowDtype)
+
+    @staticmethod
+    def _load_json_array_stream(file_path: Path) -> Optional[pd.DataFrame]:
+        """Stream a top-level array of objects in record batches (needs ijson)."""
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return None
+        batches, buf = [], []
+        try:
+            with open(file_path, "rb") as f:
+                for rec in ijson.items(f, "item", use_float=True):
+                    buf.append(rec)
+                    if len(buf) == _JSON_BATCH_ROWS:
+                        batches.append(pa.RecordBatch.from_pylist(buf))
+                        buf = []
+            if buf or not batches:
+                batches.append(pa.RecordBatch.from_pylist(buf))
+            tbl = pa.Table.from_batches(batches)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError, TypeError, AttributeError):
+            # heterogeneous records, scalars instead of objects, or malformed
+            # input — let the full-parse path produce the usual result / error
+            return None
+        del batches, buf
+        return tbl.to_pandas(self_destruct=True, types_mapper=pd.ArrowDtype)
+
+    def _load_parquet(self, file_path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Memory-mapped Arrow read; ``self_destruct`` frees each column buffer as it
+        is converted so peak RSS stays near one copy of the table. The allocator
+        can be tuned via the ARROW_DEFAULT_MEMORY_POOL environment variable.
+        Column chunks are decoded in parallel on Arrow's CPU pool, and ``columns``
+        is pushed down so unselected columns are never read.
+        """
+        try:
+            import pyarrow.parquet as pq
         except ImportError:
             raise ImportError("pyarrow is required for .parquet files: pip install pyarrow")
+        if columns and not set(columns).issubset(pq.read_schema(str(file_path)).names):
+            columns = None   # read everything; load_dataframe reports the missing names
+        try:
+            tbl = pq.read_table(str(file_path), columns=columns, use_threads=True, memory_map=True)
+        except OSError:
+            # memory_map is only valid for local files
+            tbl = pq.read_table(str(file_path), columns=columns, use_threads=True)
+        # Arrow-backed dtypes: no per-cell Python str objects are created
+        df = tbl.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+        del tbl
+        return df
 
     def _load_xml(self, file_path: Path) -> pd.DataFrame:
         try:
-            return pd.read_xml(file_path, dtype=str)
+            # Text stays text (leading zeros etc.), but in Arrow string buffers rather than objects
+            return pd.read_xml(file_path, dtype=pd.StringDtype("pyarrow"))
         except Exception as e:
             raise ValueError(f"Could not parse XML: {str(e)}")
 
+    # ── Streaming readers (iter_dataframe) ────────────────────────────────
+
+    def _iter_csv(self, file_path: Path, ext: str, chunksize: int) -> Iterator[pd.DataFrame]:
+        sep = "\t" if ext == ".tsv" else ","
+        for encoding in dict.fromkeys((_sniff_encoding(file_path), "latin-1")):
+            yielded = False
+            try:
+                with pd.read_csv(file_path, sep=sep, dtype=str, encoding=encoding,
+                                 chunksize=chunksize) as reader:
+                    for chunk in reader:
+                        yield chunk
+                        yielded = True
+                return
+            except UnicodeDecodeError:
+                # Only restart with latin-1 if no chunk has been handed out yet
+                if yielded or encoding == "latin-1":
+                    raise
+
+    def _iter_parquet(self, file_path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("pyarrow is required for .parquet files: pip install pyarrow")
+        for batch in pq.ParquetFile(str(file_path)).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def _iter_excel_rows(
+        self, file_path: Path, sheet_name: Optional[str], chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        from openpyxl import load_workbook
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            ws = wb[sheet_name] if (sheet_name and sheet_name in wb.sheetnames) else wb.worksheets[0]
+            yield from self._chunk_rows(ws.iter_rows(values_only=True), chunksize)
+        finally:
+            wb.close()
+
+    def _iter_xlsb(
+        self, file_path: Path, sheet_name: Optional[str], chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        try:
+            import pyxlsb
+        except ImportError:
+            raise ImportError("pyxlsb is required for .xlsb files: pip install pyxlsb")
+        with pyxlsb.open_workbook(str(file_path)) as wb:
+            sheets = wb.sheets
+            if not sheets:
+                raise ValueError("No sheets found in .xlsb workbook.")
+            target = sheet_name if (sheet_name and sheet_name in sheets) else sheets[0]
+            with wb.get_sheet(target) as sheet:
+                rows = ([cell.v for cell in row] for row in sheet.rows())
+                yield from self._chunk_rows(rows, chunksize)
+
+    @staticmethod
+    def _chunk_rows(rows, chunksize: int) -> Iterator[pd.DataFrame]:
+        """First row is the header; remaining rows are yielded as str-valued chunks."""
+        header = next(rows, None)
+        if header is None:
+            return
+        headers = [str(h).strip() if h is not None else f"Column_{i}" for i, h in enumerate(header)]
+        width   = len(headers)
+        buf: List[list] = []
+        for row in rows:
+            vals = [None if v is None else str(v) for v in row[:width]]
+            vals.extend([None] * (width - len(vals)))
+            buf.append(vals)
+            if len(buf) >= chunksize:
+                yield pd.DataFrame(buf, columns=headers, dtype=object)
+                buf = []
+        if buf:
+            yield pd.DataFrame(buf, columns=headers, dtype=object)
+
     @staticmethod
     def _normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Strip header whitespace and give missing cells the markers the rest of
+        the app expects, one column at a time: None in object columns, and for
+        Arrow/nullable columns (whose ``pd.NA`` openpyxl and friends reject)
+        float NaN when numeric, otherwise object with None. Columns without
+        missing cells keep their dtype.
+        """
         df.columns = df.columns.str.strip()
-        return df.where(pd.notnull(df), None)
+        for i, dtype in enumerate(df.dtypes):
+            if not (dtype == object or isinstance(dtype, pd.api.extensions.ExtensionDtype)):
+                continue
+            col  = df.iloc[:, i]
+            mask = col.isna()
+            if not mask.any():
+                continue
+            if dtype.kind in "iuf":
+                df.isetitem(i, col.to_numpy(dtype=np.float64, na_value=np.nan))
+            else:
+                df.isetitem(i, col.astype(object).mask(mask, None))
+        return df
+
+
+def _usecols(columns: Optional[List[str]]):
+    """pandas ``usecols`` matching headers as they will read after whitespace stripping."""
+    if not columns:
+        return None
+    wanted = set(columns)
+    return lambda name: str(name).strip() in wanted
+
+
+# ── JSON records ─────────────────────────────────────────────────────────
+
+_JSON_BATCH_ROWS = 10_000
+
+
+def _records_to_frame(records) -> pd.DataFrame:
+    """
+    List-of-dicts → DataFrame through Arrow's C++ row→column transpose, in
+    batches of ``_JSON_BATCH_ROWS``. Falls back to ``pd.DataFrame`` for records
+    Arrow cannot type (mixed value types, non-dict rows).
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return pd.DataFrame(records)
+    if not records or not isinstance(records[0], dict):
+        return pd.DataFrame(records)
+    try:
+        tbl = pa.Table.from_batches([
+            pa.RecordBatch.from_pylist(records[i:i + _JSON_BATCH_ROWS])
+            for i in range(0, len(records), _JSON_BATCH_ROWS)
+        ])
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, AttributeError):
+        return pd.DataFrame(records)
+    return tbl.to_pandas(self_destruct=True, types_mapper=pd.ArrowDtype)
+
+
+# ── Dictionary encoding ──────────────────────────────────────────────────
+# Low-cardinality text columns (codes, statuses, categories) become int32
+# indices into one shared dictionary instead of a Python str per cell.
+
+_DICT_ENCODE_MIN_ROWS  = 10_000
+_DICT_ENCODE_MAX_RATIO = 0.5
+
+
+def _dictionary_encode(df: pd.DataFrame) -> pd.DataFrame:
+    if len(df) <= _DICT_ENCODE_MIN_ROWS:
+        return df
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return df
+    dict_dtype = pd.ArrowDtype(pa.dictionary(pa.int32(), pa.string()))
+    for i in range(df.shape[1]):
+        col = df.iloc[:, i]
+        if not (col.dtype == object or pd.api.types.is_string_dtype(col.dtype)):
+            continue
+        if col.nunique() / len(col) >= _DICT_ENCODE_MAX_RATIO:
+            continue
+        try:
+            df.isetitem(i, col.astype(dict_dtype))
+        except (TypeError, ValueError, pa.ArrowException):
+            pass   # mixed-type object column — keep as is
+    return df
+
+
+# ── Parse cache ───────────────────────────────────────────────────────────
+# Keyed on _FileMeta (resolved path + mtime + size): an overwritten upload
+# has a new mtime/size and therefore misses the cache.
+
+_LOAD_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=_LOAD_CACHE_SIZE)
+def _cached_load(
+    meta: _FileMeta, sheet_name: Optional[str], columns: tuple, dictionary_encode: bool = False,
+) -> pd.DataFrame:
+    return FileLoaderService(dictionary_encode)._load_dataframe_uncached(
+        meta, sheet_name, list(columns) or None,
+    )
+
+
+@lru_cache(maxsize=_LOAD_CACHE_SIZE)
+def _cached_sheet_names(meta: _FileMeta) -> tuple:
+    return tuple(FileLoaderService()._get_sheet_names_uncached(meta))
+
+
+def _load_one_worker(path: Path, dictionary_encode: bool = False) -> pd.DataFrame:
+    """Process-pool entry point for ``load_many`` (must be top-level to pickle)."""
+    return FileLoaderService(dictionary_encode).load_dataframe(path)
 
 
 # ── Legacy shim ───────────────────────────────────────────────────────────
@@ -240,6 +830,10 @@ class LegacyFileLoader:
     def load_data(path: str, sheet: Optional[str] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
         return FileLoaderService().load_dataframe(Path(path), sheet, columns)
 
+    @staticmethod
+    def iter_data(path: str, chunksize: int = 100_000, sheet: Optional[str] = None) -> Iterator[pd.DataFrame]:
+        return FileLoaderService().iter_dataframe(Path(path), chunksize, sheet)
+
     @staticmethod
     def load_csv_data(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
         return LegacyFileLoader.load_data(path=path, columns=columns)
@@ -261,6 +855,29 @@ def setup_directories():
         AppConfig.RULES_DIR.mkdir(exist_ok=True)
 
 
+_UNLINK_WORKERS = 16
+
+
+def _purge_dir(root: Path) -> None:
+    """
+    ``shutil.rmtree`` equivalent that overlaps the per-file unlink syscalls on a
+    thread pool, then removes the (now empty) directories bottom-up. Raises the
+    first unlink/rmdir error, like rmtree does.
+    """
+    files, dirs = [], []
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        files.extend(os.path.join(dirpath, n) for n in filenames)
+        files.extend(p for p in (os.path.join(dirpath, n) for n in dirnames) if os.path.islink(p))
+        dirs.append(dirpath)
+    if len(files) > 1:
+        with ThreadPoolExecutor(max_workers=min(_UNLINK_WORKERS, len(files))) as pool:
+            list(pool.map(os.unlink, files))
+    elif files:
+        os.unlink(files[0])
+    for d in dirs:   # os.walk(topdown=False) yields children before parents
+        os.rmdir(d)
+
+
 def clean_temp_directory():
     """Clean temporary directory with robust error handling."""
     if not AppConfig.TEMP_DIR.exists():
@@ -268,7 +885,7 @@ def clean_temp_directory():
         return
     try:
         gc.collect()
-        shutil.rmtree(AppConfig.TEMP_DIR)
+        _purge_dir(AppConfig.TEMP_DIR)
         AppConfig.TEMP_DIR.mkdir(exist_ok=True)
     except PermissionError:
         for file_path in AppConfig.TEMP_DIR.iterdir():
@@ -294,7 +911,11 @@ def clean_temp_directory_safe(max_retries: int = 3) -> bool:
         try:
             gc.collect()
             if AppConfig.TEMP_DIR.exists():
-                shutil.rmtree(AppConfig.TEMP_DIR)
+                try:
+                    _purge_dir(AppConfig.TEMP_DIR)
+                except PermissionError:
+                    # locked file (WinError 32): let rmtree retry what's left
+                    shutil.rmtree(AppConfig.TEMP_DIR)
             AppConfig.TEMP_DIR.mkdir(exist_ok=True)
             return True
         except (PermissionError, OSError):
@@ -309,8 +930,14 @@ def clean_temp_directory_safe(max_retries: int = 3) -> bool:
 def save_uploaded_file(uploaded_file, directory: Path) -> Path:
     """Save a Streamlit UploadedFile to disk."""
     file_path = Path(directory) / uploaded_file.name
+    getbuffer = getattr(uploaded_file, "getbuffer", None)
     with open(file_path, "wb") as f:
-        f.write(uploaded_file.getbuffer())
+        if getbuffer is not None:
+            # In-memory upload: write straight from a memoryview, no bytes copy
+            f.write(getbuffer())
+        else:
+            # Disk-backed file object: stream in 1 MiB chunks
+            shutil.copyfileobj(uploaded_file, f, length=1 << 20)
     return file_path
 
 
@@ -319,13 +946,14 @@ def get_timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S")
 
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def format_file_size(size_bytes: int) -> str:
     """Human-readable file size."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} TB"
+    # unit index straight from the bit length: each unit is 10 more bits
+    i = min((int(size_bytes).bit_length() - 1) // 10, 4) if size_bytes >= 1024 else 0
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_UNITS[i]}"
 
 
 def clean_value(value):
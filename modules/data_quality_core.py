@@ -10,16 +10,152 @@ Contains:
 ══════════════════════════════════════════════════════════════════════════
 """
 
+import os
 import re
 import json
 import datetime
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from types import CodeType
 from collections import defaultdict
-from typing import Dict, List, Tuple, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Tuple, Any, Optional
 
 from modules.config import RULE_ALIAS_MAP
 
+try:
+    import cudf   # optional GPU backend (RAPIDS)
+except ImportError:
+    cudf = None
+
+try:
+    import pyarrow   # enables Arrow-backed string columns for text rules
+except ImportError:
+    pyarrow = None
+
+EMAIL_RE           = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_SPECIAL_CHARS_RE  = r'[^A-Za-z0-9\s]'
+_STRING_DTYPE      = "string[pyarrow]" if pyarrow is not None else "string"
+
+# Pattern features where RE2 (Arrow) and Python ``re`` can disagree: inline
+# groups/flags, backrefs and octal escapes, \Z / \u escapes, {,n} and POSIX
+# classes are never sent to Arrow; ASCII-only classes and ``$`` only when the
+# column data can't tell the two engines apart.
+_RE2_UNSAFE        = re.compile(r'\(\?(?!:)|\\[0-9ZuUN]|\{,|\[:')
+_RE2_ASCII_CLASSES = re.compile(r'\\[dDwWsSbB]')
+_SEVERITY_RANK     = {"LOW": 1, "MEDIUM": 2, "HIGH": 3}
+_GPU_MIN_ROWS      = 50_000
+_PARALLEL_MIN_ROWS = 10_000
+_PROBE_ROWS        = 1_000
+
+# date_format patterns pandas' vectorized strptime accepts no more loosely than
+# datetime.strptime (no %f, which takes nanoseconds; no timezone/locale/week codes)
+_VECTOR_DATE_FORMAT = re.compile(r'(?:[^%]|%[YmdHMSyBbAajpI%])*')
+
+
+def _resolve_backend(backend: str, n_rows: int) -> str:
+    """'auto' picks cuDF for large frames when it is installed, else pandas."""
+    if backend == "cudf" and cudf is None:
+        raise ImportError("cudf is required for backend='cudf' (RAPIDS)")
+    if backend == "auto":
+        return "cudf" if cudf is not None and n_rows >= _GPU_MIN_ROWS else "pandas"
+    return backend
+
+
+def _object_array(items: List) -> np.ndarray:
+    """1-D object array holding ``items`` as-is (lists are not broadcast)."""
+    arr = np.empty(len(items), dtype=object)
+    arr[:] = items
+    return arr
+
+
+# ── Custom expressions ────────────────────────────────────────────────────
+
+_FORBIDDEN_EXPR_TOKENS = ("import", "exec", "eval", "__", "open", "file")
+
+
+def _compile_expression(expression: str) -> Optional[CodeType]:
+    """Safety-check and byte-compile a custom expression once per rule.
+
+    Returns ``None`` for unsafe or unparsable expressions, which then fail
+    every row exactly as before.
+    """
+    if any(kw in expression for kw in _FORBIDDEN_EXPR_TOKENS):
+        return None
+    try:
+        return compile(expression, "<rule>", "eval")
+    except (SyntaxError, ValueError):
+        return None
+
+
+# ── Issue aggregation ─────────────────────────────────────────────────────
+# Names (rule types, columns, dimensions) get one bit each; a row's set is the
+# OR of its failed rules' bit rows. Universes over 64 names span several words.
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _name_bits(names_per_rule: List[List[str]], sort: bool = False) -> Tuple[List[str], np.ndarray]:
+    """(universe, lut) where ``lut[j]`` is rule j's name set as uint64 words."""
+    universe = list(dict.fromkeys(n for names in names_per_rule for n in names))
+    if sort:
+        universe.sort()
+    pos = {n: b for b, n in enumerate(universe)}
+    lut = np.zeros((len(names_per_rule), max(1, -(-len(universe) // 64))), dtype=np.uint64)
+    for j, names in enumerate(names_per_rule):
+        for n in names:
+            b = pos[n]
+            lut[j, b // 64] |= np.uint64(1 << (b % 64))
+    return universe, lut
+
+
+def _or_rows_numpy(failed: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    out = np.zeros((failed.shape[0], lut.shape[1]), dtype=np.uint64)
+    for j in range(failed.shape[1]):
+        out[failed[:, j]] |= lut[j]
+    return out
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _or_rows_numba(failed, lut):
+        n_rows, n_rules = failed.shape
+        n_words = lut.shape[1]
+        out = np.zeros((n_rows, n_words), dtype=np.uint64)
+        for i in prange(n_rows):
+            for j in range(n_rules):
+                if failed[i, j]:
+                    for k in range(n_words):
+                        out[i, k] |= lut[j, k]
+        return out
+
+
+def _or_rows(failed: np.ndarray, lut: np.ndarray) -> np.ndarray:
+    """Per-row OR of the bit rows of failed rules — JIT-compiled when numba is installed."""
+    if njit is not None and failed.size:
+        return _or_rows_numba(failed, lut)
+    return _or_rows_numpy(failed, lut)
+
+
+def _decode_bits(words: np.ndarray, universe: List[str]) -> List[str]:
+    names = []
+    for k, word in enumerate(words.tolist()):
+        while word:
+            low = word & -word
+            names.append(universe[k * 64 + low.bit_length() - 1])
+            word ^= low
+    return names
+
+
+def _decode_distinct(bits: np.ndarray, universe: List[str]) -> Tuple[List[List[str]], np.ndarray]:
+    """Decode each distinct bitset row once; returns (names per distinct set, row → set)."""
+    distinct, inverse = np.unique(bits, axis=0, return_inverse=True)
+    return [_decode_bits(words, universe) for words in distinct], inverse.reshape(-1)
+
 
 # ══════════════════════════════════════════════════════════════════════════
 #  RULEBOOK BUILDER
@@ -62,11 +198,14 @@ class RulebookBuilderService:
           severity               — HIGH / MEDIUM / LOW
         """
         rules = []
+        seen: Dict[Tuple, Dict] = {}
+        duplicates = 0
         col_name_field   = self._detect_column_field(rules_df)
         rule_type_field  = self._detect_rule_field(rules_df)
         dimension_field  = self._detect_dimension_field(rules_df)
 
-        for _, row in rules_df.iterrows():
+        # Plain dicts: no per-row Series construction / dtype upcasting
+        for row in rules_df.to_dict(orient="records"):
             column = row.get(col_name_field)
             if not column or pd.isna(column):
                 continue
@@ -82,18 +221,34 @@ class RulebookBuilderService:
                     if col in base_columns else None
                 )
 
-            if rule:
-                rules.append(rule)
+            if not rule:
+                continue
+            # Identical checks are kept once, with the stricter severity
+            key = self._rule_key(rule)
+            kept = seen.get(key)
+            if kept is not None:
+                duplicates += 1
+                if _SEVERITY_RANK.get(rule["severity"].upper(), 0) > _SEVERITY_RANK.get(kept["severity"].upper(), 0):
+                    kept["severity"] = rule["severity"]
+                continue
+            seen[key] = rule
+            rules.append(rule)
 
         return {
             "rules": rules,
             "metadata": {
                 "created": datetime.datetime.now().isoformat(),
                 "total_rules": len(rules),
+                "duplicate_rules_removed": duplicates,
                 "source": "rules_dataset",
             },
         }
 
+    @staticmethod
+    def _rule_key(rule: Dict) -> Tuple:
+        target = tuple(rule["columns"]) if "columns" in rule else rule.get("column")
+        return (rule.get("rule_type"), target, rule.get("expression"), rule.get("dimension"))
+
     # ── Field detectors ────────────────────────────────────────────────
 
     def _detect_column_field(self, df: pd.DataFrame) -> str:
@@ -121,7 +276,7 @@ class RulebookBuilderService:
 
     def _build_combination_rule(
         self,
-        row: pd.Series,
+        row: Dict[str, Any],
         column_combination: str,
         rule_field: str,
         dimension_field: Optional[str],
@@ -152,7 +307,7 @@ class RulebookBuilderService:
 
     def _build_single_rule(
         self,
-        row: pd.Series,
+        row: Dict[str, Any],
         column: str,
         rule_field: str,
         dimension_field: Optional[str],
@@ -211,26 +366,53 @@ class RulebookBuilderService:
 class RuleExecutorEngine:
     """Execute validation rules dynamically with proper column/dimension tracking."""
 
-    def __init__(self, df: pd.DataFrame, rulebook: Dict):
+    def __init__(self, df: pd.DataFrame, rulebook: Dict, backend: str = "auto"):
         self.df = df
         self.rulebook = rulebook
-        self.duplicate_cache: Dict[str, set] = {}
+        self.backend  = _resolve_backend(backend, len(df))
+        self.duplicate_masks: Dict[str, np.ndarray] = {}
         self.combination_duplicates: Dict[str, List[List[int]]] = {}
+        self.combo_masks: Dict[str, np.ndarray] = {}
+        self._patterns: Dict[int, Optional[re.Pattern]] = {}
+        self._codes: Dict[int, Optional[CodeType]] = {}
+        self._string_texts: Dict[str, pd.Series] = {}
+        self._regex_masks: Dict[Tuple[str, str, int, bool], np.ndarray] = {}
+        self._parsed_dates: Dict[Tuple[str, str], np.ndarray] = {}
+        self._validators: Dict[int, Optional[Callable]] = {}
+        self.null_masks: Dict[str, np.ndarray] = {}
+        self._precompute_null_masks()
         self._precompute_duplicates()
         self._precompute_combination_duplicates()
+        self._compile_rules()
 
     # ── Pre-computation ────────────────────────────────────────────────
 
+    def _precompute_null_masks(self):
+        """One vectorized null/blank mask per column referenced by a rule."""
+        for rule in self.rulebook.get("rules", []):
+            for col in rule.get("columns") or [rule.get("column")]:
+                if col in self.df.columns and col not in self.null_masks:
+                    self.null_masks[col] = self._compute_null_mask(col)
+
     def _precompute_duplicates(self):
-        """Pre-compute duplicate row-indices for all columns."""
-        for col in self.df.columns:
-            value_counts = self.df[col].value_counts()
-            dup_vals = value_counts[value_counts > 1].index.tolist()
-            dup_indices: set = set()
-            for val in dup_vals:
-                if not self._is_null_or_empty(val):
-                    dup_indices.update(self.df[self.df[col] == val].index.tolist())
-            self.duplicate_cache[col] = dup_indices
+        """Pre-compute a positional duplicate mask for each column a uniqueness
+        rule targets; other columns are hashed only if a check asks for them.
+
+        One hash pass per column (``duplicated(keep=False)``); null/blank values
+        never count as duplicates.
+        """
+        for rule in self.rulebook.get("rules", []):
+            if rule.get("rule_type") == "uniqueness":
+                self._duplicate_mask(rule.get("column"))
+
+    def _duplicate_mask(self, column: str) -> Optional[np.ndarray]:
+        if column not in self.df.columns:
+            return None
+        mask = self.duplicate_masks.get(column)
+        if mask is None:
+            dup  = self._duplicated([column])
+            mask = self.duplicate_masks[column] = dup & ~self._null_mask(column)
+        return mask
 
     def _precompute_combination_duplicates(self):
         """Pre-compute duplicate row-indices for column combinations."""
@@ -240,90 +422,489 @@ class RuleExecutorEngine:
                 if len(columns) < 2:
                     continue
                 combo_key = " + ".join(columns)
-                combo_vals = self.df[columns].apply(tuple, axis=1)
-                value_counts = combo_vals.value_counts()
-                dup_groups: List[List[int]] = []
-                for val in value_counts[value_counts > 1].index.tolist():
-                    if any(self._is_null_or_empty(v) for v in val):
-                        continue
-                    indices = self.df[combo_vals == val].index.tolist()
-                    if len(indices) > 1:
-                        dup_groups.append(indices)
+                null_any  = np.logical_or.reduce([self._null_mask(c) for c in columns])
+                if self.backend == "cudf":
+                    mask       = self._duplicated(columns) & ~null_any
+                    dup_groups = self._label_groups(columns, mask)
+                else:
+                    mask, dup_groups = self._combination_groups(columns, null_any)
+                self.combo_masks[combo_key] = mask
                 self.combination_duplicates[combo_key] = dup_groups
 
+    def _combination_groups(self, columns: List[str], null_any: np.ndarray) -> Tuple[np.ndarray, List[List[int]]]:
+        """Duplicate mask and label groups from one ``groupby(...).ngroup()`` hash pass.
+
+        Groups come back in order of first appearance; rows with a null/blank
+        part are excluded.
+        """
+        codes = self.df.groupby(columns, sort=False, dropna=False).ngroup().to_numpy()
+        sizes = np.bincount(codes, minlength=1)
+        mask  = (sizes[codes] > 1) & ~null_any
+        if not mask.any():
+            return mask, []
+        pos    = np.flatnonzero(mask)
+        pos    = pos[np.argsort(codes[pos], kind="stable")]
+        bounds = np.flatnonzero(np.diff(codes[pos])) + 1
+        labels = self.df.index
+        return mask, [labels[g].tolist() for g in np.split(pos, bounds)]
+
+    def _label_groups(self, columns: List[str], mask: np.ndarray) -> List[List[int]]:
+        if not mask.any():
+            return []
+        subset = self.df.loc[mask, columns]
+        labels = subset.index
+        groups = subset.groupby(columns, sort=False).indices
+        return [labels[pos].tolist() for pos in groups.values() if len(pos) > 1]
+
+    def _duplicated(self, columns: List[str]) -> np.ndarray:
+        """``duplicated(keep=False)`` over the columns — hashed on the GPU when the
+        cuDF backend is active, falling back to pandas for columns cuDF can't hold
+        (e.g. mixed-type object columns)."""
+        if self.backend == "cudf":
+            try:
+                return cudf.from_pandas(self.df[columns]).duplicated(keep=False).to_numpy()
+            except Exception:
+                pass
+        return self.df.duplicated(subset=columns, keep=False).to_numpy()
+
     def get_combination_duplicates(self) -> Dict[str, List[List[int]]]:
         return self.combination_duplicates
 
     # ── Main execution ─────────────────────────────────────────────────
 
-    def execute_all_rules(self) -> pd.DataFrame:
-        """Execute all rules; return annotated results DataFrame."""
-        results = []
-
-        for idx, row in self.df.iterrows():
-            row_issues:   List[str]  = []
-            row_failed_rules:   List[str]  = []
-            row_failed_columns: List[str]  = []
-            row_dimensions: set = set()
-            row_failed_details: List[Dict] = []
-
-            for rule in self.rulebook.get("rules", []):
-                res = self._execute_single_rule(row, rule, idx)
-                if not res["passed"]:
-                    row_issues.append(res["message"])
-                    row_failed_rules.append(res["rule_type"])
-                    cols = res.get("columns") or ([res["column"]] if res.get("column") else [])
-                    row_failed_columns.extend(cols)
-                    row_dimensions.add(res["dimension"])
-                    row_failed_details.append({
-                        "column":    res.get("column") or " + ".join(res.get("columns", [])),
-                        "rule_type": res["rule_type"],
-                        "dimension": res["dimension"],
-                        "message":   res["message"],
-                    })
-
-            result_row = row.to_dict()
-            result_row["Issues"]               = " | ".join(row_issues) if row_issues else ""
-            result_row["Count of issues"]      = len(row_issues)
-            result_row["Failed_Rules"]         = ", ".join(set(row_failed_rules))
-            result_row["Failed_Columns"]       = ", ".join(set(row_failed_columns))
-            result_row["Issue categories"]     = ", ".join(sorted(row_dimensions))
-            result_row["_failed_columns_list"] = list(set(row_failed_columns))
-            result_row["_failed_rules_details"]= row_failed_details
-            results.append(result_row)
-
-        return pd.DataFrame(results)
-
-    # ── Single rule dispatcher ─────────────────────────────────────────
+    def execute_all_rules(self, early_exit: bool = False) -> pd.DataFrame:
+        """Execute all rules; return annotated results DataFrame.
+
+        Each rule is evaluated once over its whole column into a boolean fail
+        mask; the per-row Issues / Failed_* fields are then assembled from the
+        (rows × rules) mask matrix.
+
+        With ``early_exit`` only the clean/dirty partition is exact: rules run
+        most-failing first and each one skips rows an earlier rule already
+        failed, so a dirty row reports its first failures, not all of them.
+        """
+        rules  = self.rulebook.get("rules", [])
+        n_rows = len(self.df)
+        if early_exit:
+            failed, errors = self._evaluate_until_failed(rules)
+        else:
+            failed = np.zeros((n_rows, len(rules)), dtype=bool)
+            errors: List[Dict[int, str]] = []
+            for j, (mask, errs) in enumerate(self._evaluate_rules(rules)):
+                failed[:, j] = mask
+                errors.append(errs)
+        info = [self._rule_info(rule) for rule in rules]
+
+        # Per-row rule-type / column / dimension sets as bitsets over each
+        # universe (dimensions in sorted order, so decoding yields sorted names)
+        rule_names, rule_lut = _name_bits([[rule_type] for _, rule_type, _, _, _ in info])
+        col_names,  col_lut  = _name_bits([cols for _, _, cols, _, _ in info])
+        dim_names,  dim_lut  = _name_bits([[dim] for _, _, _, _, dim in info], sort=True)
+        counts    = failed.sum(axis=1)
+        rule_bits = _or_rows(failed, rule_lut)
+        col_bits  = _or_rows(failed, col_lut)
+        dim_bits  = _or_rows(failed, dim_lut)
+
+        # Clean rows keep the preallocated defaults; only failing rows are visited
+        issues       = np.full(n_rows, "", dtype=object)
+        failed_rules = np.full(n_rows, "", dtype=object)
+        failed_cols  = np.full(n_rows, "", dtype=object)
+        categories   = np.full(n_rows, "", dtype=object)
+        col_lists    = _object_array([[] for _ in range(n_rows)])
+        details      = _object_array([[] for _ in range(n_rows)])
+        # Rows share few distinct rule/column/dimension sets: decode each once
+        rows = np.flatnonzero(counts)
+        rule_sets, rule_of = _decode_distinct(rule_bits[rows], rule_names)
+        col_sets,  col_of  = _decode_distinct(col_bits[rows], col_names)
+        dim_sets,  dim_of  = _decode_distinct(dim_bits[rows], dim_names)
+        failed_rules[rows] = _object_array([", ".join(n) for n in rule_sets])[rule_of]
+        failed_cols[rows]  = _object_array([", ".join(n) for n in col_sets])[col_of]
+        categories[rows]   = _object_array([", ".join(n) for n in dim_sets])[dim_of]
+
+        for i, cols in zip(rows.tolist(), col_of.tolist()):
+            row_issues:         List[str]  = []
+            row_failed_details: List[Dict] = details[i]
+            for j in np.flatnonzero(failed[i]):
+                message, rule_type, _, detail_col, dimension = info[j]
+                message = errors[j].get(i, message)
+                row_issues.append(message)
+                row_failed_details.append({
+                    "column":    detail_col,
+                    "rule_type": rule_type,
+                    "dimension": dimension,
+                    "message":   message,
+                })
+
+            issues[i]    = " | ".join(row_issues)
+            col_lists[i] = list(col_sets[cols])
+
+        # Shallow copy: the input columns are shared, only new columns are added
+        results = self.df.copy(deep=False)
+        results.index = pd.RangeIndex(n_rows)
+        results["Issues"]               = issues
+        results["Count of issues"]      = counts.astype(np.int64)
+        results["Failed_Rules"]         = failed_rules
+        results["Failed_Columns"]       = failed_cols
+        results["Issue categories"]     = categories
+        results["_failed_columns_list"] = col_lists
+        results["_failed_rules_details"]= details
+        return results
+
+    # ── Vectorized rule evaluation ─────────────────────────────────────
+
+    def _evaluate_rules(self, rules: List[Dict]) -> List[Tuple[np.ndarray, Dict[int, str]]]:
+        """Evaluate rules independently — on a thread pool for large frames, since
+        the pandas/NumPy column kernels release the GIL."""
+        workers = min(len(rules), os.cpu_count() or 1)
+        if workers < 2 or len(self.df) < _PARALLEL_MIN_ROWS:
+            return [self._evaluate_rule(rule) for rule in rules]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self._evaluate_rule, rules))
+
+    def _evaluate_until_failed(self, rules: List[Dict]) -> Tuple[np.ndarray, List[Dict[int, str]]]:
+        """Evaluate rules in descending sampled fail rate, each only over the rows
+        still clean, stopping once every row has failed something."""
+        n_rows = len(self.df)
+        failed = np.zeros((n_rows, len(rules)), dtype=bool)
+        errors: List[Dict[int, str]] = [{} for _ in rules]
+        probe  = self._view(np.arange(min(_PROBE_ROWS, n_rows)))
+        rates  = [probe._evaluate_rule(rule)[0].mean() if n_rows else 0.0 for rule in rules]
+        clean  = np.ones(n_rows, dtype=bool)
+        for j in np.argsort(rates, kind="stable")[::-1]:
+            rows = np.flatnonzero(clean)
+            if not len(rows):
+                break
+            engine = self if len(rows) == n_rows else self._view(rows)
+            mask, errs = engine._evaluate_rule(rules[j])
+            failed[rows, j] = mask
+            errors[j]       = {int(rows[i]): msg for i, msg in errs.items()}
+            clean[rows[mask]] = False
+        return failed, errors
+
+    def _view(self, rows: np.ndarray) -> "RuleExecutorEngine":
+        """Engine over a positional row subset, reusing this engine's null and
+        duplicate masks (sliced) so uniqueness still reflects the full frame."""
+        view = RuleExecutorEngine.__new__(RuleExecutorEngine)
+        view.df       = self.df.iloc[rows]
+        view.rulebook = self.rulebook
+        view.backend  = self.backend
+        view.duplicate_masks        = {c: m[rows] for c, m in self.duplicate_masks.items()}
+        view.combination_duplicates = self.combination_duplicates
+        view.combo_masks            = {k: m[rows] for k, m in self.combo_masks.items()}
+        view.null_masks             = {c: m[rows] for c, m in self.null_masks.items()}
+        view._patterns, view._codes, view._validators = {}, {}, {}
+        view._string_texts, view._regex_masks         = {}, {}
+        view._parsed_dates                            = {}
+        view._compile_rules()
+        return view
+
+    @staticmethod
+    def _rule_info(rule: Dict) -> Tuple[str, str, List[str], str, str]:
+        """(message, rule_type, failed columns, detail column, dimension) for a rule."""
+        if rule.get("rule_type") == "uniqueness_combination":
+            columns = rule.get("columns", [])
+            return (rule.get("message", "Duplicate combination found"), "uniqueness_combination",
+                    list(columns), " + ".join(columns), rule.get("dimension", "Uniqueness"))
+        column = rule.get("column")
+        return (rule.get("message", "Validation failed"), rule.get("rule_type"),
+                [column] if column else [], column, rule.get("dimension", "General"))
+
+    def _null_mask(self, column: str) -> np.ndarray:
+        mask = self.null_masks.get(column)
+        if mask is None:
+            mask = self.null_masks[column] = self._compute_null_mask(column)
+        return mask
+
+    def _compute_null_mask(self, column: str) -> np.ndarray:
+        """Vector form of ``_is_null_or_empty`` over one column."""
+        s    = self.df[column]
+        mask = s.isna().to_numpy(dtype=bool, copy=True)
+        if s.dtype == object or pd.api.types.is_string_dtype(s.dtype):
+            text  = s.astype(str)
+            mask |= (text.str.strip().eq("") | text.str.lower().eq("nan")).to_numpy(dtype=bool, na_value=True)
+        return mask
+
+    def _text(self, column: str) -> pd.Series:
+        """``str(value)`` for every cell, as Python strings (object dtype → stdlib ``re``)."""
+        return self.df[column].astype(str).astype(object).reset_index(drop=True)
+
+    def _string_text(self, column: str) -> pd.Series:
+        """:meth:`_text` as the (Arrow-backed when available) pandas string dtype."""
+        text = self._string_texts.get(column)
+        if text is None:
+            text = self._string_texts[column] = self._text(column).astype(_STRING_DTYPE)
+        return text
+
+    def _regex_hits(self, column: str, pattern: re.Pattern, search: bool) -> np.ndarray:
+        """``re.search`` / ``re.match`` hit per row, memoized per (column, pattern)
+        so repeated validations of the same pair scan the column once."""
+        key = (column, pattern.pattern, pattern.flags, search)
+        hit = self._regex_masks.get(key)
+        if hit is None:
+            hit = self._regex_masks[key] = self._match_column(column, pattern, search)
+        return hit
+
+    def _match_column(self, column: str, pattern: re.Pattern, search: bool) -> np.ndarray:
+        """Regex hits on Arrow's RE2 kernels when that provably gives the same
+        answers as ``re``, otherwise on Python strings."""
+        if pyarrow is not None and not _RE2_UNSAFE.search(pattern.pattern):
+            text = self._string_text(column)
+            if not (
+                (_RE2_ASCII_CLASSES.search(pattern.pattern) and not text.str.isascii().all())
+                or ("$" in pattern.pattern and text.str.contains("\n", regex=False).any())
+            ):
+                try:
+                    hit = text.str.contains(pattern, regex=True) if search else text.str.match(pattern)
+                    return hit.to_numpy(dtype=bool, na_value=False)
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+                    pass
+        text = self._text(column)
+        hit  = text.str.contains(pattern, regex=True) if search else text.str.match(pattern)
+        return hit.to_numpy(dtype=bool, na_value=False)
+
+    def _unparsed_dates(self, column: str, fmt: str) -> np.ndarray:
+        """Rows ``pd.to_datetime(format=fmt)`` can't parse, memoized per (column, format)."""
+        key      = (column, fmt)
+        unparsed = self._parsed_dates.get(key)
+        if unparsed is None:
+            try:
+                parsed   = pd.to_datetime(self._text(column), format=fmt, errors="coerce")
+                unparsed = parsed.isna().to_numpy(dtype=bool)
+            except (ValueError, TypeError):
+                unparsed = np.ones(len(self.df), dtype=bool)
+            self._parsed_dates[key] = unparsed
+        return unparsed
+
+    def _evaluate_rule(self, rule: Dict) -> Tuple[np.ndarray, Dict[int, str]]:
+        """
+        Evaluate one rule over every row. Returns the fail mask plus per-row
+        message overrides for rows whose check raised (``"msg (Error: …)"``),
+        matching the scalar path exactly. Cells the vector form can't decide
+        (e.g. values only Python's ``float()`` accepts) go through the scalar
+        check individually.
+        """
+        n_rows = len(self.df)
+        key    = id(rule)
+        validator = self._validators[key] if key in self._validators else self._build_validator(rule)
+        if validator is None:
+            return np.zeros(n_rows, dtype=bool), {}
+
+        column  = rule.get("column")
+        present = ~self._null_mask(column) if column in self.df.columns else None
+        try:
+            failed, undecided = validator(present)
+        except Exception:
+            failed, undecided = np.zeros(n_rows, dtype=bool), present
+
+        failed = np.asarray(failed, dtype=bool)
+        errors: Dict[int, str] = {}
+        if undecided is not None and undecided.any():
+            failed = failed.copy()
+            values = self.df[column].to_numpy(dtype=object)
+            labels = self.df.index
+            for i in np.flatnonzero(undecided):
+                res = self._check_value(rule, values[i], labels[i])
+                failed[i] = not res["passed"]
+                if not res["passed"] and res["message"] != rule.get("message", "Validation failed"):
+                    errors[i] = res["message"]
+        return failed, errors
+
+    # ── Rule validators ────────────────────────────────────────────────
+    # Each builder parses a rule's static parameters once and returns a
+    # closure ``validator(present) -> (fail mask, rows for the scalar check)``,
+    # where ``present`` is the column's not-null/blank mask. A builder returns
+    # None when the rule can never fail (e.g. no expression).
+
+    def _compile_rules(self):
+        for rule in self.rulebook.get("rules", []):
+            if rule.get("rule_type") == "custom_expression" and rule.get("expression"):
+                self._codes[id(rule)] = _compile_expression(str(rule["expression"]))
+            self._validators[id(rule)] = self._build_validator(rule)
+
+    def _build_validator(self, rule: Dict) -> Optional[Callable]:
+        rule_type = rule.get("rule_type")
+        if rule_type == "uniqueness_combination":
+            columns = rule.get("columns", [])
+            mask    = self.combo_masks.get(" + ".join(columns)) if len(columns) >= 2 else None
+            return None if mask is None else (lambda present: (mask, None))
+
+        column  = rule.get("column")
+        builder = self._BUILDERS.get(rule_type)
+        if column not in self.df.columns or builder is None:
+            return None
+        try:
+            return builder(self, rule, column)
+        except Exception:
+            # Static parameters don't parse: the scalar path raises per row and
+            # reports the same "(Error: …)" message as before
+            return self._scalar_only
+
+    @staticmethod
+    def _scalar_only(present: np.ndarray):
+        return np.zeros(len(present), dtype=bool), present
+
+    def _build_not_null(self, rule: Dict, column: str) -> Callable:
+        return lambda present: (~present, None)
+
+    def _build_uniqueness(self, rule: Dict, column: str) -> Optional[Callable]:
+        mask = self._duplicate_mask(column)
+        return None if mask is None else (lambda present: (mask, None))
+
+    def _build_pattern(self, rule: Dict, column: str) -> Optional[Callable]:
+        rule_type  = rule.get("rule_type")
+        expression = rule.get("expression")
+        if rule_type == "email_format":
+            pattern = EMAIL_RE
+        elif rule_type == "regex" and not expression:
+            return None
+        else:
+            try:
+                pattern = re.compile(str(expression or _SPECIAL_CHARS_RE))
+            except re.error:
+                self._patterns[id(rule)] = None
+                return self._scalar_only
+        self._patterns[id(rule)] = pattern
+
+        if rule_type == "no_special_chars":
+            return lambda present: (present & self._regex_hits(column, pattern, search=True), None)
+        return lambda present: (present & ~self._regex_hits(column, pattern, search=False), None)
+
+    def _build_allowed_values(self, rule: Dict, column: str) -> Optional[Callable]:
+        expression = rule.get("expression")
+        if not expression:
+            return None
+        allowed = [v.strip() for v in str(expression).split(",")]
+        return lambda present: (
+            present & ~self._string_text(column).isin(allowed).to_numpy(dtype=bool, na_value=False), None
+        )
+
+    def _numbers(self, column: str, present: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Column as floats, plus the present rows pandas couldn't parse."""
+        nums = pd.to_numeric(self.df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        return nums, present & np.isnan(nums)
+
+    def _build_numeric_only(self, rule: Dict, column: str) -> Callable:
+        def validator(present):
+            _, undecided = self._numbers(column, present)
+            return np.zeros(len(present), dtype=bool), undecided
+        return validator
+
+    def _build_range(self, rule: Dict, column: str) -> Optional[Callable]:
+        expression = rule.get("expression")
+        if not expression:
+            return None
+        mn, mx = map(float, str(expression).split(","))
+
+        def validator(present):
+            nums, undecided = self._numbers(column, present)
+            with np.errstate(invalid="ignore"):
+                in_range = (mn <= nums) & (nums <= mx)
+            return present & ~undecided & ~in_range, undecided
+        return validator
+
+    def _build_length(self, rule: Dict, column: str) -> Optional[Callable]:
+        expression = rule.get("expression")
+        if not expression:
+            return None
+        if "," in str(expression):
+            mn, mx = map(int, str(expression).split(","))
+        else:
+            mn = mx = int(expression)
+
+        def validator(present):
+            lengths = self._string_text(column).str.len().to_numpy(dtype=float, na_value=np.nan)
+            return present & ~((mn <= lengths) & (lengths <= mx)), None
+        return validator
+
+    def _build_alpha_only(self, rule: Dict, column: str) -> Callable:
+        def validator(present):
+            alpha = self._text(column).str.replace(" ", "", regex=False).str.isalpha()
+            return present & ~alpha.to_numpy(dtype=bool, na_value=False), None
+        return validator
+
+    def _build_contains(self, rule: Dict, column: str) -> Optional[Callable]:
+        expression = rule.get("expression")
+        if not expression:
+            return None
+        needle = str(expression)
+        negate = rule.get("rule_type") == "contains"
+
+        def validator(present):
+            # Plain substring search on the string dtype — never the regex engine
+            hit = (self._string_text(column)
+                   .str.contains(needle, regex=False, na=False)
+                   .to_numpy(dtype=bool))
+            return present & (~hit if negate else hit), None
+        return validator
+
+    def _build_date_format(self, rule: Dict, column: str) -> Callable:
+        fmt = rule.get("expression") or "%Y-%m-%d"
+        if not isinstance(fmt, str) or not _VECTOR_DATE_FORMAT.fullmatch(fmt):
+            return self._scalar_only
+
+        def validator(present):
+            # Rows pandas parses pass; the rest get strptime for the exact
+            # verdict and error message
+            return np.zeros(len(present), dtype=bool), present & self._unparsed_dates(column, fmt)
+        return validator
+
+    def _build_custom_expression(self, rule: Dict, column: str) -> Optional[Callable]:
+        if not rule.get("expression"):
+            return None
+        return lambda present: (np.zeros(len(present), dtype=bool), np.ones(len(present), dtype=bool))
+
+    _BUILDERS: Dict[str, Callable] = {
+        "not_null":          _build_not_null,
+        "uniqueness":        _build_uniqueness,
+        "regex":             _build_pattern,
+        "no_special_chars":  _build_pattern,
+        "email_format":      _build_pattern,
+        "allowed_values":    _build_allowed_values,
+        "numeric_only":      _build_numeric_only,
+        "range":             _build_range,
+        "length":            _build_length,
+        "alpha_only":        _build_alpha_only,
+        "contains":          _build_contains,
+        "not_contains":      _build_contains,
+        "date_format":       _build_date_format,
+        "custom_expression": _build_custom_expression,
+    }
+
+    # ── Single rule dispatcher (scalar path) ───────────────────────────
 
     def _execute_single_rule(self, row: pd.Series, rule: Dict, row_idx: int) -> Dict:
         rule_type = rule.get("rule_type")
-        message   = rule.get("message", "Validation failed")
         dimension = rule.get("dimension", "General")
 
         if rule_type == "uniqueness_combination":
             return self._execute_combination_uniqueness(row, rule, row_idx)
 
-        column     = rule.get("column")
-        expression = rule.get("expression")
-
+        column = rule.get("column")
         if column not in row.index:
             return {"passed": True, "message": "", "rule_type": rule_type,
                     "column": column, "dimension": dimension}
+        return self._check_value(rule, row[column], row_idx)
 
-        value  = row[column]
-        passed = True
+    def _check_value(self, rule: Dict, value, row_idx) -> Dict:
+        rule_type  = rule.get("rule_type")
+        message    = rule.get("message", "Validation failed")
+        dimension  = rule.get("dimension", "General")
+        column     = rule.get("column")
+        expression = rule.get("expression")
+        passed     = True
 
         try:
             if rule_type == "not_null":
                 passed = not self._is_null_or_empty(value)
 
             elif rule_type == "uniqueness":
-                passed = row_idx not in self.duplicate_cache.get(column, set())
+                mask   = self._duplicate_mask(column)
+                passed = mask is None or not np.any(mask[self.df.index.get_loc(row_idx)])
 
             elif rule_type == "regex":
                 if not self._is_null_or_empty(value) and expression:
-                    passed = bool(re.match(str(expression), str(value)))
+                    pattern = self._patterns.get(id(rule)) or str(expression)
+                    passed  = bool(re.match(pattern, str(value)))
 
             elif rule_type == "allowed_values":
                 if not self._is_null_or_empty(value) and expression:
@@ -346,15 +927,12 @@ class RuleExecutorEngine:
 
             elif rule_type == "no_special_chars":
                 if not self._is_null_or_empty(value):
-                    pattern = expression if expression else r'[^A-Za-z0-9\s]'
-                    passed  = not bool(re.search(str(pattern), str(value)))
+                    pattern = self._patterns.get(id(rule)) or str(expression if expression else _SPECIAL_CHARS_RE)
+                    passed  = not bool(re.search(pattern, str(value)))
 
             elif rule_type == "email_format":
                 if not self._is_null_or_empty(value):
-                    passed = bool(re.match(
-                        r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
-                        str(value),
-                    ))
+                    passed = bool(EMAIL_RE.match(str(value)))
 
             elif rule_type == "numeric_only":
                 if not self._is_null_or_empty(value):
@@ -381,7 +959,10 @@ class RuleExecutorEngine:
 
             elif rule_type == "custom_expression":
                 if expression:
-                    passed = self._evaluate_safe_expression(value, expression)
+                    code = self._codes.get(id(rule), False)
+                    if code is False:
+                        code = self._codes[id(rule)] = _compile_expression(str(expression))
+                    passed = self._evaluate_safe_expression(value, code)
 
         except Exception as e:
             passed  = False
@@ -407,8 +988,8 @@ class RuleExecutorEngine:
                     "columns": columns, "dimension": dimension}
 
         combo_key = " + ".join(columns)
-        dup_groups = self.combination_duplicates.get(combo_key, [])
-        passed = all(row_idx not in grp for grp in dup_groups)
+        mask      = self.combo_masks.get(combo_key)
+        passed    = mask is None or not np.any(mask[self.df.index.get_loc(row_idx)])
 
         return {
             "passed":    passed,
@@ -423,15 +1004,26 @@ class RuleExecutorEngine:
 
     @staticmethod
     def _is_null_or_empty(value) -> bool:
-        return (
-            value is None
-            or (isinstance(value, float) and pd.isna(value))
-            or str(value).strip() == ""
-            or str(value).lower() == "nan"
-        )
+        if value is None or value is pd.NA:
+            return True
+        if isinstance(value, str):
+            return not value.strip() or value.lower() == "nan"
+        if isinstance(value, float):
+            return value != value
+        if isinstance(value, (int, np.integer)):
+            return False
+        text = str(value)
+        return not text.strip() or text.lower() == "nan"
 
     @staticmethod
-    def _evaluate_safe_expression(value, expression: str) -> bool:
+    def _evaluate_safe_expression(value, code: Optional[CodeType]) -> bool:
+        """Evaluate a precompiled expression; ``None`` (unsafe/invalid) fails."""
+        if code is None:
+            return False
+        # Arrow/nullable columns keep pd.NA (and NaT/NaN) for missing cells;
+        # expressions have always seen None there
+        if value is pd.NA or value is pd.NaT or (isinstance(value, float) and value != value):
+            value = None
         try:
             safe_builtins = {"__builtins__": {}}
             safe_vars = {
@@ -439,9 +1031,7 @@ class RuleExecutorEngine:
                 "int": int, "float": float, "abs": abs,
                 "min": min, "max": max,
             }
-            if any(kw in expression for kw in ["import", "exec", "eval", "__", "open", "file"]):
-                return False
-            return bool(eval(expression, safe_builtins, safe_vars))
+            return bool(eval(code, safe_builtins, safe_vars))
         except Exception:
             return False
 
@@ -453,9 +1043,10 @@ class RuleExecutorEngine:
 class DataQualityEngine:
     """High-level DQ orchestrator used by app.py."""
 
-    def __init__(self, df: pd.DataFrame, rules_path: Path):
+    def __init__(self, df: pd.DataFrame, rules_path: Path, backend: str = "auto"):
         self.df         = df
         self.rules_path = Path(rules_path)
+        self.backend    = backend
         self.rulebook   = self._load_rulebook()
         self.results_df = None
 
@@ -470,7 +1061,7 @@ class DataQualityEngine:
         return builder.build_from_rules_dataset(rules_df, self.df.columns.tolist())
 
     def run(self) -> Dict[str, Any]:
-        executor        = RuleExecutorEngine(self.df, self.rulebook)
+        executor        = RuleExecutorEngine(self.df, self.rulebook, self.backend)
         self.results_df = executor.execute_all_rules()
 
         from modules.reporting_core import ScoringService
@@ -10,17 +10,22 @@ Contains:
 """
 
 import json
+import math
 import logging
 import datetime
 import pandas as pd
 import numpy as np
 from io import BytesIO
+from copy import copy
 from pathlib import Path
 from collections import defaultdict
 from typing import Dict, List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
+# Columns the rule executor appends to the data; never scored as data columns
+_RESULT_COLUMNS = frozenset({"Issues", "Count of issues", "Failed_Rules", "Failed_Columns", "Issue categories"})
+
 
 # ══════════════════════════════════════════════════════════════════════════
 #  SCORING SERVICE
@@ -34,7 +39,7 @@ class ScoringService:
         total = len(results_df)
         if total == 0:
             return 0.0
-        clean = len(results_df[results_df["Count of issues"] == 0])
+        clean = _clean_count(results_df)
         return round((clean / total) * 100, 2)
 
     @staticmethod
@@ -47,14 +52,13 @@ class ScoringService:
             return {}
 
         failed_tracker: Dict[str, set] = defaultdict(set)
-        for idx, row in results_df.iterrows():
-            for col in (row.get("_failed_columns_list") or []):
+        for idx, fcols in zip(*_row_arrays(results_df, "_failed_columns_list")):
+            for col in (fcols or []):
                 failed_tracker[col].add(idx)
 
         scores: Dict[str, float] = {}
-        _skip = {"Issues", "Count of issues", "Failed_Rules", "Failed_Columns", "Issue categories"}
         for col in all_columns:
-            if col.startswith("_") or col in _skip:
+            if col.startswith("_") or col in _RESULT_COLUMNS:
                 continue
             failed_count = len(failed_tracker.get(col, set()))
             scores[col] = round(((total - failed_count) / total) * 100, 2)
@@ -66,15 +70,21 @@ class ScoringService:
         if total == 0:
             return {}
 
-        dimensions: set = set()
-        for dims in results_df["Issue categories"].dropna():
-            dimensions.update(d.strip() for d in str(dims).split(",") if d.strip())
+        # Few distinct category strings: split each once, weighted by its row count
+        cats   = results_df["Issue categories"].astype("category")
+        codes  = cats.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(cats.cat.categories))
+        failed_by_dim: Dict[str, int] = defaultdict(int)
+        for value, rows in zip(cats.cat.categories, counts.tolist()):
+            if not rows:
+                continue
+            for dim in {d.strip() for d in str(value).split(",")} - {""}:
+                failed_by_dim[dim] += rows
 
-        scores: Dict[str, float] = {}
-        for dim in dimensions:
-            failed = len(results_df[results_df["Issue categories"].str.contains(dim, na=False)])
-            scores[dim] = round(((total - failed) / total) * 100, 2)
-        return scores
+        return {
+            dim: round(((total - failed_by_dim[dim]) / total) * 100, 2)
+            for dim in sorted(failed_by_dim)
+        }
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -83,6 +93,17 @@ class ScoringService:
 
 def clean_value(val):
     """Clean and format cell values for Excel output."""
+    # Fast paths for the common object-column cells, without pd.isna dispatch
+    if val is None:
+        return ""
+    cls = type(val)
+    if cls is str:
+        str_val = val.strip()
+        return "" if str_val.lower() == "nan" else str_val
+    if cls is float:
+        return "" if math.isnan(val) else val
+    if cls is int:
+        return val
     try:
         if pd.isna(val):
             return ""
@@ -100,6 +121,68 @@ def clean_value(val):
     return "" if str_val.lower() == "nan" else str_val
 
 
+_clean_values = np.frompyfunc(clean_value, 1, 1)   # clean_value over an object array
+
+
+def _clean_column(series: pd.Series) -> pd.Series:
+    """Apply clean_value to a column, dispatching on its dtype.
+
+    Only the per-cell paths can raise (on exotic objects); they fall back to
+    the column's string form.
+    """
+    dtype = series.dtype
+    if dtype == np.bool_:
+        return series.map({True: "Yes", False: "No"})
+    if isinstance(dtype, np.dtype) and dtype.kind in "iu":
+        return series                   # clean_value returns ints unchanged
+    if isinstance(dtype, np.dtype) and dtype.kind == "f":
+        return series.where(series.notna(), "") if series.hasnans else series
+    try:
+        if dtype == object or isinstance(dtype, pd.StringDtype):
+            return pd.Series(_clean_values(series.to_numpy(dtype=object)),
+                             index=series.index, name=series.name)
+        return series.apply(clean_value)
+    except Exception:
+        return series.astype(str)
+
+
+def _clean_count(results_df: pd.DataFrame) -> int:
+    """Rows with zero issues, counted on the raw array (no filtered frame)."""
+    return int(np.count_nonzero(results_df["Count of issues"].to_numpy() == 0))
+
+
+def _row_arrays(df: pd.DataFrame, column: str) -> Tuple[list, np.ndarray]:
+    """(index labels, values of ``column``) for zip-iteration without per-row
+    Series; values are all None when the column is absent."""
+    labels = df.index.tolist()
+    if column in df.columns:
+        return labels, df[column].to_numpy(dtype=object)
+    return labels, np.full(len(labels), None, dtype=object)
+
+
+def _cell_text(value) -> str:
+    """A cleaned value as the text written to record cells (None → "")."""
+    return str(value) if value is not None else ""
+
+
+_cell_texts = np.frompyfunc(_cell_text, 1, 1)      # _cell_text over an object array
+
+
+def _sorted_rows(rows) -> np.ndarray:
+    """A collection of row positions as a sorted int64 array."""
+    arr = np.fromiter(rows, dtype=np.int64, count=len(rows))
+    arr.sort()
+    return arr
+
+
+def _union_rows(arrays) -> np.ndarray:
+    """Sorted distinct row positions across several row arrays."""
+    arrays = list(arrays)
+    if not arrays:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(arrays))
+
+
 def get_timestamp() -> str:
     return datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -108,6 +191,136 @@ def get_timestamp() -> str:
 #  EXCEL REPORT GENERATOR
 # ══════════════════════════════════════════════════════════════════════════
 
+_WRITE_ONLY_MIN_ROWS = 50_000
+
+# Cell formats as xlsxwriter format dicts; the write-only path translates them
+_FORMAT_SPECS: Dict[str, Dict] = {
+    "title":       {"bold": True, "font_size": 14, "bg_color": "#4472C4", "font_color": "white", "align": "center", "valign": "vcenter", "border": 1},
+    "subtitle":    {"bold": True, "font_size": 11, "bg_color": "#D9E1F2", "align": "left", "border": 1},
+    "header":      {"bold": True, "bg_color": "#4472C4", "font_color": "white", "border": 1, "align": "center", "valign": "vcenter"},
+    "pass":        {"bg_color": "#C6EFCE", "font_color": "#006100", "bold": True, "align": "center", "border": 1},
+    "fail":        {"bg_color": "#FFC7CE", "font_color": "#9C0006", "bold": True, "align": "center", "border": 1},
+    "warning":     {"bg_color": "#FFEB9C", "font_color": "#9C6500", "bold": True, "align": "center", "border": 1},
+    "data":        {"border": 1, "align": "left", "valign": "vcenter"},
+    "data_center": {"border": 1, "align": "center", "valign": "vcenter"},
+    "metric":      {"bold": True, "align": "right", "border": 1},
+    "percentage":  {"num_format": "0.00%", "align": "right", "border": 1},
+}
+
+
+def _openpyxl_style(spec: Dict) -> Dict:
+    """openpyxl Font/Fill/Border/Alignment objects for one xlsxwriter format dict."""
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+    def color(value: str) -> str:
+        return "FFFFFFFF" if value == "white" else "FF" + value.lstrip("#")
+
+    style = {"font": Font(bold=spec.get("bold", False), size=spec.get("font_size", 11),
+                          color=color(spec["font_color"]) if "font_color" in spec else None)}
+    if "bg_color" in spec:
+        style["fill"] = PatternFill("solid", fgColor=color(spec["bg_color"]))
+    if spec.get("border"):
+        side = Side(style="thin")
+        style["border"] = Border(left=side, right=side, top=side, bottom=side)
+    if "align" in spec or "valign" in spec:
+        valign = {"vcenter": "center"}.get(spec.get("valign"), spec.get("valign"))
+        style["alignment"] = Alignment(horizontal=spec.get("align"), vertical=valign)
+    if "num_format" in spec:
+        style["number_format"] = spec["num_format"]
+    return style
+
+
+class _WriteOnlySheet:
+    """The xlsxwriter worksheet calls the sheet builders use (``write``,
+    ``write_row``, ``set_column``) over an openpyxl write-only worksheet.
+
+    Like xlsxwriter's constant_memory mode, rows must be written top to bottom:
+    the pending row is appended once a later row is written.
+    """
+
+    def __init__(self, ws, styles: Dict):
+        self._ws     = ws
+        self._styles = styles        # id(style dict) -> registered StyleArray, shared per workbook
+        self._row    = 0
+        self._cells: Dict[int, Tuple] = {}
+
+    def set_column(self, first, last=None, width=None):
+        from openpyxl.utils import column_index_from_string, get_column_letter
+        if isinstance(first, str):          # "A:B" range notation
+            width = last
+            lo, hi = first.split(":")
+            first, last = column_index_from_string(lo) - 1, column_index_from_string(hi) - 1
+        for c in range(first, last + 1):
+            # xlsxwriter stores widths with its 0.71 character padding
+            self._ws.column_dimensions[get_column_letter(c + 1)].width = width + 0.71
+
+    def write(self, row: int, col: int, value, style: Optional[Dict] = None):
+        if row != self._row:
+            self._flush(row)
+        self._cells[col] = (value, style)
+
+    def write_row(self, row: int, col: int, values, style: Optional[Dict] = None):
+        if row != self._row:
+            self._flush(row)
+        for c, value in enumerate(values, col):
+            self._cells[c] = (value, style)
+
+    def close(self):
+        self._flush(self._row + 1)
+
+    def _style_array(self, style: Dict):
+        """Register a style dict with the workbook once; cells copy the result."""
+        from openpyxl.cell import WriteOnlyCell
+        key = id(style)
+        if key not in self._styles:
+            cell = WriteOnlyCell(self._ws)
+            for attr, obj in style.items():
+                setattr(cell, attr, obj)
+            self._styles[key] = cell._style
+        return self._styles[key]
+
+    def _flush(self, next_row: int):
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+        ws = self._ws
+        if self._cells:
+            row = [None] * (max(self._cells) + 1)
+            for c, (value, style) in self._cells.items():
+                if isinstance(value, str):
+                    value = ILLEGAL_CHARACTERS_RE.sub("", value)
+                cell = WriteOnlyCell(ws, value=value)
+                if style:
+                    cell._style = copy(self._style_array(style))
+                row[c] = cell
+            ws.append(row)
+        else:
+            ws.append([])
+        for _ in range(next_row - self._row - 1):
+            ws.append([])
+        self._row, self._cells = next_row, {}
+
+
+class _WriteOnlyWriter:
+    """Stands in for ``pd.ExcelWriter`` (``writer.book.add_worksheet``) on an
+    openpyxl write-only workbook."""
+
+    def __init__(self, workbook):
+        self.book    = self
+        self._wb     = workbook
+        self._styles: Dict = {}
+        self._sheets: List[_WriteOnlySheet] = []
+
+    def add_worksheet(self, name: str) -> _WriteOnlySheet:
+        sheet = _WriteOnlySheet(self._wb.create_sheet(name), self._styles)
+        self._sheets.append(sheet)
+        return sheet
+
+    def save(self, path: Path):
+        for sheet in self._sheets:
+            sheet.close()
+        self._wb.save(path)
+
+
 class ExcelReportGenerator:
     """Generate multi-sheet Excel DQ assessment reports."""
 
@@ -128,44 +341,87 @@ class ExcelReportGenerator:
         self.overall_score        = overall_score
         self.dimension_scores     = dimension_scores
         self.duplicate_combinations = duplicate_combinations or {}
+        # The two per-row internal columns, read once for every tracker and sheet
+        self._index, self._fcols = _row_arrays(results_df, "_failed_columns_list")
+        _, self._frules          = _row_arrays(results_df, "_failed_rules_details")
+        self._clean_count = _clean_count(results_df) if "Count of issues" in results_df.columns else 0
+        # Row → failing columns per issue sheet, filled by _build_all_trackers
+        self._completeness_cols:    Dict[int, set] = defaultdict(set)
+        self._standardization_cols: Dict[int, set] = defaultdict(set)
 
     # ── Public ────────────────────────────────────────────────────────────
 
     def generate_report(self, output_dir: Path) -> Path:
-        """Build the complete Excel workbook and return its path."""
+        """Build the complete Excel workbook and return its path.
+
+        Reports over ``_WRITE_ONLY_MIN_ROWS`` rows are streamed through
+        :meth:`generate_report_writeonly` instead.
+        """
+        if len(self.results_df) > _WRITE_ONLY_MIN_ROWS:
+            return self.generate_report_writeonly(output_dir)
+
         output_path = Path(output_dir) / "DQ_Assessment_Report.xlsx"
         Path(output_dir).mkdir(parents=True, exist_ok=True)
+        prepared = self._prepare_output()
+
+        # constant_memory streams each sheet row by row; every sheet writer
+        # below sets column widths first and then writes rows top to bottom
+        with pd.ExcelWriter(output_path, engine="xlsxwriter",
+                            engine_kwargs={"options": {"constant_memory": True}}) as writer:
+            fmt = self._make_formats(writer.book)
+            self._write_sheets(writer, fmt, *prepared)
+
+        logger.info(f"Report generated: {output_path}")
+        return output_path
 
+    def generate_report_writeonly(self, output_dir: Path) -> Path:
+        """Build the same workbook with openpyxl's write-only mode.
+
+        Rows are appended as they are written, so peak memory stays around one
+        row per sheet; styles are built once and shared by every cell.
+        """
+        from openpyxl import Workbook
+
+        output_path = Path(output_dir) / "DQ_Assessment_Report.xlsx"
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
+        prepared = self._prepare_output()
+
+        writer = _WriteOnlyWriter(Workbook(write_only=True))
+        fmt    = {name: _openpyxl_style(spec) for name, spec in _FORMAT_SPECS.items()}
+        self._write_sheets(writer, fmt, *prepared)
+        writer.save(output_path)
+
+        logger.info(f"Report generated: {output_path}")
+        return output_path
+
+    def _prepare_output(self) -> Tuple[pd.DataFrame, List[str], np.ndarray, Dict, Dict, Dict]:
+        """Cleaned output frame, display columns/array and the row trackers."""
         # Clean internal columns from output copy
         internal = [c for c in ("_failed_columns_list", "_failed_rules_details")
                     if c in self.results_df.columns]
         df_out = self.results_df.drop(columns=internal, errors="ignore").copy()
         for col in df_out.columns:
-            try:
-                df_out[col] = df_out[col].apply(clean_value)
-            except Exception:
-                df_out[col] = df_out[col].astype(str)
-
-        failed_tracker     = self._build_failed_tracker()
-        dimension_tracker  = self._build_dimension_tracker()
-        uniqueness_failures= self._build_uniqueness_failures()
-
-        with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
-            wb  = writer.book
-            fmt = self._make_formats(wb)
-
-            self._sheet_dq_score(writer, fmt)
-            self._sheet_summary(writer, df_out, fmt, failed_tracker)
-            self._sheet_results(writer, df_out, fmt)
-            self._sheet_dimension(writer, fmt)
-            self._sheet_duplicate_summary(writer, fmt)
-            self._sheets_annexures(writer, df_out, fmt, failed_tracker)
-            self._sheet_uniqueness(writer, df_out, fmt, uniqueness_failures)
-            self._sheet_completeness(writer, df_out, fmt, dimension_tracker)
-            self._sheet_standardization(writer, df_out, fmt, dimension_tracker)
+            df_out[col] = _clean_column(df_out[col])
 
-        logger.info(f"Report generated: {output_path}")
-        return output_path
+        # Record rows are read by position from one array of cell texts,
+        # converted once and shared by every sheet
+        display_cols = [c for c in df_out.columns if not c.startswith("_")]
+        text_arr     = _cell_texts(df_out[display_cols].to_numpy(dtype=object))
+
+        failed_tracker, dimension_tracker, uniqueness_failures = self._build_all_trackers()
+        return df_out, display_cols, text_arr, failed_tracker, dimension_tracker, uniqueness_failures
+
+    def _write_sheets(self, writer, fmt, df_out, display_cols, text_arr,
+                      failed_tracker, dimension_tracker, uniqueness_failures):
+        self._sheet_dq_score(writer, fmt)
+        self._sheet_summary(writer, df_out, fmt, failed_tracker)
+        self._sheet_results(writer, df_out, display_cols, text_arr, fmt)
+        self._sheet_dimension(writer, fmt)
+        self._sheet_duplicate_summary(writer, fmt)
+        self._sheets_annexures(writer, display_cols, text_arr, fmt, failed_tracker)
+        self._sheet_uniqueness(writer, display_cols, text_arr, fmt, uniqueness_failures)
+        self._sheet_completeness(writer, display_cols, text_arr, fmt, dimension_tracker)
+        self._sheet_standardization(writer, display_cols, text_arr, fmt, dimension_tracker)
 
     def save_rulebook_json(self, output_dir: Path, rulebook: Optional[Dict] = None) -> Path:
         """Save rulebook as JSON and return path."""
@@ -178,50 +434,41 @@ class ExcelReportGenerator:
 
     # ── Trackers ──────────────────────────────────────────────────────────
 
-    def _build_failed_tracker(self) -> Dict[str, set]:
-        tracker: Dict[str, set] = defaultdict(set)
-        for idx, row in self.results_df.iterrows():
-            for col in (row.get("_failed_columns_list") or []):
-                tracker[col].add(idx)
-        return tracker
-
-    def _build_dimension_tracker(self) -> Dict[str, Dict[str, set]]:
-        tracker = defaultdict(lambda: defaultdict(set))
-        for idx, row in self.results_df.iterrows():
-            for rd in (row.get("_failed_rules_details") or []):
-                if isinstance(rd, dict):
+    def _build_all_trackers(self) -> Tuple[Dict[str, np.ndarray], Dict[str, Dict[str, np.ndarray]], Dict[str, List[int]]]:
+        """(failed columns → rows, dimension → column → rows, uniqueness column →
+        rows) from a single pass over the per-row failure columns. The same pass
+        records each row's Completeness / Standardization columns.
+
+        Row sets are returned as sorted int64 arrays, ready for the sheets."""
+        failed_tracker: Dict[str, set] = defaultdict(set)
+        dimension_tracker = defaultdict(lambda: defaultdict(set))
+        uniqueness_failures: Dict[str, List[int]] = defaultdict(list)
+        for idx, fcols, details in zip(self._index, self._fcols, self._frules):
+            for col in (fcols or []):
+                failed_tracker[col].add(idx)
+            for rd in (details or []):
+                if not isinstance(rd, dict):
+                    continue
+                col = rd.get("column")
+                if col:
                     dim = rd.get("dimension", "General")
-                    col = rd.get("column")
-                    if col:
-                        tracker[dim][col].add(idx)
-        return tracker
-
-    def _build_uniqueness_failures(self) -> Dict[str, List[int]]:
-        failures: Dict[str, List[int]] = defaultdict(list)
-        for idx, row in self.results_df.iterrows():
-            for rd in (row.get("_failed_rules_details") or []):
-                if isinstance(rd, dict) and rd.get("rule_type") == "uniqueness":
-                    col = rd.get("column")
-                    if col:
-                        failures[col].append(idx)
-        return failures
+                    dimension_tracker[dim][col].add(idx)
+                    if dim == "Completeness":
+                        self._completeness_cols[idx].add(col)
+                    elif dim in ("Standardization", "Validation"):
+                        self._standardization_cols[idx].add(col)
+                    if rd.get("rule_type") == "uniqueness":
+                        uniqueness_failures[col].append(idx)
+        failed_rows    = {col: _sorted_rows(rows) for col, rows in failed_tracker.items()}
+        dimension_rows = {dim: {col: _sorted_rows(rows) for col, rows in cols.items()}
+                          for dim, cols in dimension_tracker.items()}
+        return failed_rows, dimension_rows, uniqueness_failures
 
     # ── Formats ───────────────────────────────────────────────────────────
 
     @staticmethod
     def _make_formats(wb) -> Dict:
-        return {
-            "title":       wb.add_format({"bold": True, "font_size": 14, "bg_color": "#4472C4", "font_color": "white", "align": "center", "valign": "vcenter", "border": 1}),
-            "subtitle":    wb.add_format({"bold": True, "font_size": 11, "bg_color": "#D9E1F2", "align": "left", "border": 1}),
-            "header":      wb.add_format({"bold": True, "bg_color": "#4472C4", "font_color": "white", "border": 1, "align": "center", "valign": "vcenter"}),
-            "pass":        wb.add_format({"bg_color": "#C6EFCE", "font_color": "#006100", "bold": True, "align": "center", "border": 1}),
-            "fail":        wb.add_format({"bg_color": "#FFC7CE", "font_color": "#9C0006", "bold": True, "align": "center", "border": 1}),
-            "warning":     wb.add_format({"bg_color": "#FFEB9C", "font_color": "#9C6500", "bold": True, "align": "center", "border": 1}),
-            "data":        wb.add_format({"border": 1, "align": "left", "valign": "vcenter"}),
-            "data_center": wb.add_format({"border": 1, "align": "center", "valign": "vcenter"}),
-            "metric":      wb.add_format({"bold": True, "align": "right", "border": 1}),
-            "percentage":  wb.add_format({"num_format": "0.00%", "align": "right", "border": 1}),
-        }
+        return {name: wb.add_format(spec) for name, spec in _FORMAT_SPECS.items()}
 
     # ── Sheets ────────────────────────────────────────────────────────────
 
@@ -236,7 +483,7 @@ class ExcelReportGenerator:
                  fmt["pass"] if self.overall_score >= 80 else fmt["fail"])
         ws.write(5, 0, "Total Records",   fmt["data"])
         ws.write(5, 1, len(self.results_df), fmt["data_center"])
-        clean = len(self.results_df[self.results_df["Count of issues"] == 0])
+        clean = self._clean_count
         ws.write(6, 0, "Clean Records",  fmt["data"])
         ws.write(6, 1, clean,            fmt["data_center"])
         ws.write(7, 0, "Records with Issues", fmt["data"])
@@ -246,53 +493,75 @@ class ExcelReportGenerator:
 
     def _sheet_summary(self, writer, df_out, fmt, failed_tracker):
         ws = writer.book.add_worksheet("Column Summary")
-        ws.write(0, 0, "COLUMN-LEVEL DQ SUMMARY", fmt["title"])
         headers = ["Column", "Total Records", "Failed Records", "DQ Score %", "Status"]
-        for c, h in enumerate(headers):
-            ws.write(2, c, h, fmt["header"])
-            ws.set_column(c, c, 20)
+        ws.set_column(0, len(headers) - 1, 20)
+        ws.write(0, 0, "COLUMN-LEVEL DQ SUMMARY", fmt["title"])
+        ws.write_row(2, 0, headers, fmt["header"])
         total = len(self.results_df)
-        for r, col in enumerate(self.all_columns, 3):
-            if col.startswith("_") or col in {"Issues", "Count of issues", "Failed_Rules", "Failed_Columns", "Issue categories"}:
-                continue
-            failed = len(failed_tracker.get(col, set()))
-            score  = self.column_scores.get(col, 100.0)
-            ws.write(r, 0, col, fmt["data"])
-            ws.write(r, 1, total,  fmt["data_center"])
-            ws.write(r, 2, failed, fmt["data_center"])
-            ws.write(r, 3, f"{score:.2f}%", fmt["pass"] if score >= 80 else fmt["fail"])
-            ws.write(r, 4, "PASS" if score >= 80 else "FAIL",
-                     fmt["pass"] if score >= 80 else fmt["fail"])
-
-    def _sheet_results(self, writer, df_out, fmt):
+        write = ws.write
+        data_fmt, center_fmt = fmt["data"], fmt["data_center"]
+        # Rows keep their position in all_columns; skipped columns leave a gap
+        rows = [(r, col) for r, col in enumerate(self.all_columns, 3)
+                if not (col.startswith("_") or col in _RESULT_COLUMNS)]
+        scores   = np.array([self.column_scores.get(col, 100.0) for _, col in rows], dtype=float)
+        passed   = scores >= 80
+        statuses = np.where(passed, "PASS", "FAIL").tolist()
+        formats  = np.where(passed, 1, 0).tolist()
+        status_fmts = (fmt["fail"], fmt["pass"])
+        for (r, col), score, status, f in zip(rows, scores.tolist(), statuses, formats):
+            status_fmt = status_fmts[f]
+            write(r, 0, col, data_fmt)
+            write(r, 1, total, center_fmt)
+            write(r, 2, len(failed_tracker.get(col, ())), center_fmt)
+            write(r, 3, f"{score:.2f}%", status_fmt)
+            write(r, 4, status, status_fmt)
+
+    def _sheet_results(self, writer, df_out, cols, text_arr, fmt):
         ws = writer.book.add_worksheet("Detailed Results")
+        if cols:
+            ws.set_column(0, len(cols) - 1, 18)
         ws.write(0, 0, "DETAILED VALIDATION RESULTS", fmt["title"])
-        cols = [c for c in df_out.columns if not c.startswith("_")]
-        for c, h in enumerate(cols):
-            ws.write(2, c, h, fmt["header"])
-            ws.set_column(c, c, 18)
-        for r, (_, row) in enumerate(df_out.iterrows(), 3):
-            issue_count = row.get("Count of issues", 0)
-            row_fmt = fmt["fail"] if issue_count else fmt["pass"]
-            for c, col in enumerate(cols):
-                val = row[col]
-                ws.write(r, c, str(val) if val is not None else "", row_fmt if col in ("Issues", "Count of issues") else fmt["data"])
+        ws.write_row(2, 0, cols, fmt["header"])
+        counts  = df_out["Count of issues"].tolist() if "Count of issues" in df_out.columns else [0] * len(df_out)
+        flagged = [c for c, col in enumerate(cols) if col in ("Issues", "Count of issues")]
+        # Runs of plain columns between the flagged ones, so every cell is written once
+        bounds  = [-1] + flagged + [len(cols)]
+        plain   = [(lo + 1, hi) for lo, hi in zip(bounds, bounds[1:]) if hi > lo + 1]
+        write, write_row     = ws.write, ws.write_row
+        data_fmt             = fmt["data"]
+        pass_fmt, fail_fmt   = fmt["pass"], fmt["fail"]
+        for r, (cells, issue_count) in enumerate(zip(text_arr, counts), 3):
+            row_fmt = fail_fmt if issue_count else pass_fmt
+            texts   = cells.tolist()
+            for lo, hi in plain:
+                write_row(r, lo, texts[lo:hi], data_fmt)
+            for c in flagged:
+                write(r, c, texts[c], row_fmt)
 
     def _sheet_dimension(self, writer, fmt):
         ws = writer.book.add_worksheet("Dimension Scores")
+        ws.set_column(0, 2, 22)
         ws.write(0, 0, "DQ DIMENSION SCORES", fmt["title"])
         ws.write(2, 0, "Dimension",  fmt["header"])
         ws.write(2, 1, "Score %",    fmt["header"])
         ws.write(2, 2, "Status",     fmt["header"])
-        ws.set_column(0, 2, 22)
-        for r, (dim, score) in enumerate(self.dimension_scores.items(), 3):
-            ws.write(r, 0, dim, fmt["data"])
-            ws.write(r, 1, f"{score:.2f}%", fmt["data_center"])
-            ws.write(r, 2, "PASS" if score >= 80 else "FAIL",
-                     fmt["pass"] if score >= 80 else fmt["fail"])
+        write = ws.write
+        data_fmt, center_fmt = fmt["data"], fmt["data_center"]
+        scores   = np.fromiter(self.dimension_scores.values(), dtype=float, count=len(self.dimension_scores))
+        passed   = scores >= 80
+        statuses = np.where(passed, "PASS", "FAIL").tolist()
+        formats  = np.where(passed, 1, 0).tolist()
+        status_fmts = (fmt["fail"], fmt["pass"])
+        for r, (dim, score, status, f) in enumerate(
+                zip(self.dimension_scores, scores.tolist(), statuses, formats), 3):
+            write(r, 0, dim, data_fmt)
+            write(r, 1, f"{score:.2f}%", center_fmt)
+            write(r, 2, status, status_fmts[f])
 
     def _sheet_duplicate_summary(self, writer, fmt):
         ws = writer.book.add_worksheet("Duplicate Summary")
+        if self.duplicate_combinations:
+            ws.set_column(0, 2, 30)
         ws.write(0, 0, "COMBINATION UNIQUENESS SUMMARY", fmt["title"])
         if not self.duplicate_combinations:
             ws.write(2, 0, "No combination uniqueness rules evaluated.", fmt["subtitle"])
@@ -300,119 +569,98 @@ class ExcelReportGenerator:
         ws.write(2, 0, "Column Combination", fmt["header"])
         ws.write(2, 1, "Duplicate Groups",   fmt["header"])
         ws.write(2, 2, "Total Dup Records",  fmt["header"])
-        ws.set_column(0, 2, 30)
         for r, (combo, groups) in enumerate(self.duplicate_combinations.items(), 3):
             total_dup = sum(len(g) for g in groups)
             ws.write(r, 0, combo,       fmt["data"])
             ws.write(r, 1, len(groups), fmt["data_center"])
             ws.write(r, 2, total_dup,   fmt["data_center"])
 
-    def _sheets_annexures(self, writer, df_out, fmt, failed_tracker):
+    def _sheets_annexures(self, writer, display_cols, text_arr, fmt, failed_tracker):
         """Per-column annexure sheets for columns with failures."""
-        display_cols = [c for c in df_out.columns if not c.startswith("_")]
-        for col, indices in failed_tracker.items():
-            if not indices:
-                continue
+        failing = [(col, indices) for col, indices in failed_tracker.items() if len(indices)]
+        for col, indices in failing:
             sheet_name = f"ANN_{col[:25]}"
             ws = writer.book.add_worksheet(sheet_name)
+            if display_cols:
+                ws.set_column(0, len(display_cols) - 1, 18)
             ws.write(0, 0, f"ANNEXURE: {col}", fmt["title"])
             ws.write(1, 0, f"Failed Records: {len(indices)}", fmt["subtitle"])
-            for c, h in enumerate(display_cols):
-                ws.write(3, c, h, fmt["header"])
-                ws.set_column(c, c, 18)
-            for r, idx in enumerate(sorted(indices), 4):
+            ws.write_row(3, 0, display_cols, fmt["header"])
+            for r, idx in enumerate(indices.tolist(), 4):
                 try:
-                    record = df_out.iloc[idx]
-                    for c, col_name in enumerate(display_cols):
-                        ws.write(r, c, str(record[col_name]) if record[col_name] is not None else "", fmt["data"])
+                    ws.write_row(r, 0, text_arr[idx].tolist(), fmt["data"])
                 except Exception:
                     continue
 
-    def _sheet_uniqueness(self, writer, df_out, fmt, uniqueness_failures):
+    def _sheet_uniqueness(self, writer, display_cols, text_arr, fmt, uniqueness_failures):
         ws = writer.book.add_worksheet("Uniqueness Issues")
+        header_cols  = ["Row_Index", "Failed_Column", "Issue_Type"] + display_cols
+        if uniqueness_failures:
+            ws.set_column(0, len(header_cols) - 1, 18)
         ws.write(0, 0, "UNIQUENESS VALIDATION — DUPLICATE RECORDS", fmt["title"])
         if not uniqueness_failures:
             ws.write(1, 0, "No duplicate records found", fmt["subtitle"])
             ws.write(2, 0, "Status: ✅ PASSED", fmt["pass"])
             return
-        all_dup_indices: set = set()
         col_map: Dict[int, List[str]] = {}
         for col, indices in uniqueness_failures.items():
             for idx in indices:
-                all_dup_indices.add(idx)
                 col_map.setdefault(idx, []).append(col)
+        all_dup_indices = _sorted_rows(col_map)
         ws.write(1, 0, f"Total Duplicate Records: {len(all_dup_indices)}", fmt["subtitle"])
         ws.write(2, 0, "Status: ❌ FAILED — DUPLICATES FOUND", fmt["fail"])
-        display_cols = [c for c in df_out.columns if not c.startswith("_")]
-        header_cols  = ["Row_Index", "Failed_Column", "Issue_Type"] + display_cols
-        for c, h in enumerate(header_cols):
-            ws.write(4, c, h, fmt["header"])
-            ws.set_column(c, c, 18)
-        for r, idx in enumerate(sorted(all_dup_indices), 5):
+        ws.write_row(4, 0, header_cols, fmt["header"])
+        for r, idx in enumerate(all_dup_indices.tolist(), 5):
             try:
                 ws.write(r, 0, idx, fmt["data"])
                 ws.write(r, 1, ", ".join(col_map.get(idx, [])), fmt["data"])
                 ws.write(r, 2, "Uniqueness Violation", fmt["fail"])
-                record = df_out.iloc[idx]
-                for c, col_name in enumerate(display_cols, 3):
-                    ws.write(r, c, str(record[col_name]) if record[col_name] is not None else "", fmt["data"])
+                ws.write_row(r, 3, text_arr[idx].tolist(), fmt["data"])
             except Exception:
                 continue
 
-    def _sheet_completeness(self, writer, df_out, fmt, dimension_tracker):
-        indices: set = set()
-        for col_set in dimension_tracker.get("Completeness", {}).values():
-            indices.update(col_set)
+    def _sheet_completeness(self, writer, display_cols, text_arr, fmt, dimension_tracker):
+        indices = _union_rows(dimension_tracker.get("Completeness", {}).values())
         ws = writer.book.add_worksheet("Completeness Issues")
+        header_cols  = ["Row_Index", "Incomplete_Columns"] + display_cols
+        if len(indices):
+            ws.set_column(0, len(header_cols) - 1, 20)
         ws.write(0, 0, "COMPLETENESS VALIDATION — MISSING VALUES", fmt["title"])
-        if not indices:
+        if not len(indices):
             ws.write(1, 0, "No completeness issues found", fmt["subtitle"])
             ws.write(2, 0, "Status: ✅ PASSED", fmt["pass"])
             return
         ws.write(1, 0, f"Total Records with Missing Values: {len(indices)}", fmt["subtitle"])
         ws.write(2, 0, "Status: ❌ FAILED", fmt["fail"])
-        display_cols = [c for c in df_out.columns if not c.startswith("_")]
-        for c, h in enumerate(["Row_Index", "Incomplete_Columns"] + display_cols):
-            ws.write(4, c, h, fmt["header"])
-            ws.set_column(c, c, 20)
-        for r, idx in enumerate(sorted(indices), 5):
+        ws.write_row(4, 0, header_cols, fmt["header"])
+        for r, idx in enumerate(indices.tolist(), 5):
             try:
                 ws.write(r, 0, idx, fmt["data"])
-                bad_cols = [rd["column"] for rd in (self.results_df.iloc[idx].get("_failed_rules_details") or [])
-                            if isinstance(rd, dict) and rd.get("dimension") == "Completeness" and rd.get("column")]
-                ws.write(r, 1, ", ".join(sorted(set(bad_cols))), fmt["data"])
-                record = df_out.iloc[idx]
-                for c, col_name in enumerate(display_cols, 2):
-                    ws.write(r, c, str(record[col_name]) if record[col_name] is not None else "", fmt["data"])
+                ws.write(r, 1, ", ".join(sorted(self._completeness_cols.get(idx, ()))), fmt["data"])
+                ws.write_row(r, 2, text_arr[idx].tolist(), fmt["data"])
             except Exception:
                 continue
 
-    def _sheet_standardization(self, writer, df_out, fmt, dimension_tracker):
-        indices: set = set()
-        for dim_key in ("Standardization", "Validation"):
-            for col_set in dimension_tracker.get(dim_key, {}).values():
-                indices.update(col_set)
+    def _sheet_standardization(self, writer, display_cols, text_arr, fmt, dimension_tracker):
+        indices = _union_rows(rows for dim_key in ("Standardization", "Validation")
+                              for rows in dimension_tracker.get(dim_key, {}).values())
         ws = writer.book.add_worksheet("Standardization Issues")
+        header_cols  = ["Row_Index", "Non_Standard_Columns"] + display_cols
+        if len(indices):
+            ws.set_column(0, len(header_cols) - 1, 20)
         ws.write(0, 0, "STANDARDIZATION VALIDATION — FORMAT ISSUES", fmt["title"])
-        if not indices:
+        if not len(indices):
             ws.write(1, 0, "No standardization issues found", fmt["subtitle"])
             ws.write(2, 0, "Status: ✅ PASSED", fmt["pass"])
             return
         ws.write(1, 0, f"Total Records with Standardization Issues: {len(indices)}", fmt["subtitle"])
         ws.write(2, 0, "Status: ❌ FAILED", fmt["fail"])
-        display_cols = [c for c in df_out.columns if not c.startswith("_")]
-        for c, h in enumerate(["Row_Index", "Non_Standard_Columns"] + display_cols):
-            ws.write(4, c, h, fmt["header"])
-            ws.set_column(c, c, 20)
-        for r, idx in enumerate(sorted(indices), 5):
+        ws.write_row(4, 0, header_cols, fmt["header"])
+        for r, idx in enumerate(indices.tolist(), 5):
             try:
                 ws.write(r, 0, idx, fmt["data"])
-                bad_cols = [rd["column"] for rd in (self.results_df.iloc[idx].get("_failed_rules_details") or [])
-                            if isinstance(rd, dict) and rd.get("dimension") in ("Standardization", "Validation") and rd.get("column")]
-                ws.write(r, 1, ", ".join(sorted(set(bad_cols))), fmt["data"])
-                record = df_out.iloc[idx]
-                for c, col_name in enumerate(display_cols, 2):
-                    ws.write(r, c, str(record[col_name]) if record[col_name] is not None else "", fmt["data"])
+                ws.write(r, 1, ", ".join(sorted(self._standardization_cols.get(idx, ()))), fmt["data"])
+                ws.write_row(r, 2, text_arr[idx].tolist(), fmt["data"])
             except Exception:
                 continue
 
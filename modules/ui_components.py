@@ -1,7 +1,11 @@
+import functools
+import html
 import streamlit as st
+import numpy as np
 import pandas as pd
 import traceback
-from typing import Dict
+from pathlib import Path
+from typing import Dict, List
 from .config import AppConfig
 
 
@@ -13,21 +17,107 @@ _LOTTIE_URLS = {
     "success":    "https://assets3.lottiefiles.com/packages/lf20_pKiaUR.json",
 }
 
-_LOTTIE_JS_KEY = "_lottie_js_injected"
+_LOTTIE_SCRIPT_HTML = (
+    '<script src="https://unpkg.com/@lottiefiles/lottie-player@latest'
+    '/dist/lottie-player.js"></script>'
+)
+_lottie_injected = False
+
+# ── Static page text, built once at import ────────────────────────────────
+_SIDEBAR_MD = (
+    "### 📊 Supported Rules",
+    "Completeness · Uniqueness · Validity · Standardization",
+    "### 📁 File Formats",
+    "CSV · Excel · JSON · Parquet · ODS · XML · xlsx · xlsm · xlsb",
+)
+
+_FILE_FORMAT_HELP_MD = """
+            ### Rules Dataset Format (CSV/Excel)
+
+            **Required Columns:**
+            - `column_name` or `column` — Target column name
+            - `rule` or `rule_type` — Type of validation
+            - `dimension` or `rule_category` — DQ dimension
+            - `message` — Validation error message
+
+            **Optional Columns:**
+            - `expression` — Rule expression (regex, range, etc.)
+            - `severity` — HIGH, MEDIUM, or LOW
+
+            **Example:**
+            ```csv
+            column_name,rule,dimension,message,expression
+            email,not_null,Completeness,Email is required,
+            age,range,Validity,Age must be 0-120,"0,120"
+            status,allowed_values,Validity,Invalid status,"Active,Inactive"
+            ```
+
+            ### JSON Rulebook Format
+            ```json
+            {
+              "rules": [
+                {
+                  "column": "email",
+                  "rule_type": "not_null",
+                  "dimension": "Completeness",
+                  "message": "Email is required",
+                  "expression": null,
+                  "severity": "HIGH"
+                }
+              ]
+            }
+            ```
+            """
+
+_FOOTER_HTML = (
+    '<div class="text-center margin-top-1">'
+    '<p class="caption">Powered by '
+    + AppConfig.APP_TITLE + " v" + AppConfig.VERSION
+    + "</p></div>"
+)
+
+_ORBIT_LOADER_HTML = """
+            <div class="orbit-loader">
+                <div class="center-dot"></div>
+                <div class="orbiter"></div>
+                <div class="orbiter"></div>
+                <div class="orbiter"></div>
+            </div>
+        """
+
+# Scores drawn client-side as progress bars by the dataframe grid
+_SCORE_COLUMN_CONFIG = {
+    "DQ Score (%)": st.column_config.ProgressColumn(
+        "DQ Score (%)", min_value=0, max_value=100, format="%.1f%%",
+    ),
+}
+
+# Status cell classes of the column-score table (styled in assets/styles.css)
+_STATUS_CLASS = {"✅ PASSED": "dq-pass", "❌ FAILED": "dq-fail"}
 
 
 def _inject_lottie_lib() -> None:
-    """Inject lottie-player web-component script once per session."""
-    if st.session_state.get(_LOTTIE_JS_KEY):
+    """Inject lottie-player web-component script once per process."""
+    global _lottie_injected
+    if _lottie_injected:
         return
-    st.markdown(
-        '<script src="https://unpkg.com/@lottiefiles/lottie-player@latest'
-        '/dist/lottie-player.js"></script>',
-        unsafe_allow_html=True,
-    )
-    st.session_state[_LOTTIE_JS_KEY] = True
+    st.markdown(_LOTTIE_SCRIPT_HTML, unsafe_allow_html=True)
+    _lottie_injected = True
+
+
+@st.cache_data(ttl=600, max_entries=8, show_spinner=False)
+def _read_bytes(path_str: str, mtime: float) -> bytes:
+    """File contents, cached per path and modification time across reruns."""
+    with open(path_str, "rb", buffering=1 << 20) as f:
+        return f.read()
+
+
+def _file_bytes(path) -> bytes:
+    path = Path(path)
+    return _read_bytes(str(path), path.stat().st_mtime)
 
 
+@functools.lru_cache(maxsize=16)
 def _lottie_player(url: str, fallback_class: str, size: int = 120) -> str:
     return f"""
     <div class="orbit-loader"
@@ -38,6 +128,38 @@ def _lottie_player(url: str, fallback_class: str, size: int = 120) -> str:
         <div class="orbiter"></div>
     </div>
     """
+
+
+# Bubble class for the active step by step type, and inner HTML per class
+_ACTIVE_BUBBLE_CLASS = {"upload": "active-upload", "process": "processing"}
+_BUBBLE_INNER = {
+    "done":          '<span class="wf-check">✓</span>',
+    "active-upload": '<span class="wf-icon">{icon}</span>',
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _workflow_tracker_html(active_step: int) -> str:
+    """Finished tracker HTML; only a handful of distinct active steps exist."""
+    steps = UIComponents._WORKFLOW_STEPS
+
+    classes    = ["done" if i < active_step else
+                  "pending" if i > active_step else
+                  _ACTIVE_BUBBLE_CLASS.get(step["type"], "active")
+                  for i, step in enumerate(steps)]
+    inners     = [_BUBBLE_INNER.get(cls, "{icon}").format(icon=step["icon"])
+                  for step, cls in zip(steps, classes)]
+    step_html  = [f"""
+                <div class="wf-step">
+                    <div class="wf-bubble {cls}">{inner}</div>
+                    <span class="wf-label">{step['label']}</span>
+                </div>
+            """ for step, cls, inner in zip(steps, classes, inners)]
+    connectors = [f'<div class="wf-connector {"done" if i < active_step else ""}"></div>'
+                  for i in range(len(steps) - 1)] + [""]
+    return f'<div class="wf-tracker">{"".join(map(str.__add__, step_html, connectors))}</div>'
+
+
 class UIComponents:
     """Streamlit UI components — with integrated animated guidance."""
 
@@ -57,53 +179,13 @@ class UIComponents:
     @staticmethod
     def render_sidebar():
         with st.sidebar:
-            st.markdown("### 📊 Supported Rules")
-            st.markdown(
-                "Completeness · Uniqueness · Validity · Standardization"
-            )
-            st.markdown("### 📁 File Formats")
-            st.markdown("CSV · Excel · JSON · Parquet · ODS · XML · xlsx · xlsm · xlsb")
+            for text in _SIDEBAR_MD:
+                st.markdown(text)
 
     @staticmethod
     def render_file_format_help():
         with st.expander("📋 Expected File Formats"):
-            st.markdown("""
-            ### Rules Dataset Format (CSV/Excel)
-
-            **Required Columns:**
-            - `column_name` or `column` — Target column name
-            - `rule` or `rule_type` — Type of validation
-            - `dimension` or `rule_category` — DQ dimension
-            - `message` — Validation error message
-
-            **Optional Columns:**
-            - `expression` — Rule expression (regex, range, etc.)
-            - `severity` — HIGH, MEDIUM, or LOW
-
-            **Example:**
-            ```csv
-            column_name,rule,dimension,message,expression
-            email,not_null,Completeness,Email is required,
-            age,range,Validity,Age must be 0-120,"0,120"
-            status,allowed_values,Validity,Invalid status,"Active,Inactive"
-            ```
-
-            ### JSON Rulebook Format
-            ```json
-            {
-              "rules": [
-                {
-                  "column": "email",
-                  "rule_type": "not_null",
-                  "dimension": "Completeness",
-                  "message": "Email is required",
-                  "expression": null,
-                  "severity": "HIGH"
-                }
-              ]
-            }
-            ```
-            """)
+            st.markdown(_FILE_FORMAT_HELP_MD)
 
     @staticmethod
     def render_results_dashboard(
@@ -114,8 +196,8 @@ class UIComponents:
     ):
         st.subheader("📊 Data Quality Dashboard")
         col1, col2, col3, col4 = st.columns(4)
-        clean_count  = len(results_df[results_df["Count of issues"] == 0])
-        issue_count  = len(results_df) - clean_count
+        issue_count  = int(np.count_nonzero(results_df["Count of issues"].to_numpy() != 0))
+        clean_count  = len(results_df) - issue_count
         pass_columns = sum(1 for s in column_scores.values() if s == 100)
 
         col1.metric("Overall DQ Score",      f"{overall_score}%")
@@ -137,23 +219,21 @@ class UIComponents:
         st.subheader("📥 Download Reports")
         col1, col2 = st.columns(2)
         with col1:
-            with open(output_path, "rb") as f:
-                st.download_button(
-                    "📊 Download Complete Excel Report", f,
-                    file_name=output_path.name,
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    use_container_width=True,
-                    help=f"Includes: DQ Score, Results, Summary, Dimension Analysis, and {total_annexures} Annexures",
-                )
+            st.download_button(
+                "📊 Download Complete Excel Report", _file_bytes(output_path),
+                file_name=output_path.name,
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                use_container_width=True,
+                help=f"Includes: DQ Score, Results, Summary, Dimension Analysis, and {total_annexures} Annexures",
+            )
         with col2:
-            with open(rulebook_path, "rb") as f:
-                st.download_button(
-                    "📋 Download Rulebook JSON", f,
-                    file_name=rulebook_path.name,
-                    mime="application/json",
-                    use_container_width=True,
-                    help="Generated rulebook for reference and reuse",
-                )
+            st.download_button(
+                "📋 Download Rulebook JSON", _file_bytes(rulebook_path),
+                file_name=rulebook_path.name,
+                mime="application/json",
+                use_container_width=True,
+                help="Generated rulebook for reference and reuse",
+            )
 
     @staticmethod
     def render_detailed_views(
@@ -163,6 +243,8 @@ class UIComponents:
         dimension_scores: Dict[str, float],
     ):
         st.subheader("🔍 Detailed Analysis")
+        display_cols = [c for c in results_df.columns if not c.startswith("_")]
+        issue_mask   = results_df["Count of issues"].to_numpy() > 0
         tab1, tab2, tab3, tab4 = st.tabs(
             ["Column Scores", "Dimension Analysis", "Rulebook", "Results Preview"]
         )
@@ -174,24 +256,36 @@ class UIComponents:
             st.json(rulebook)
             st.info(f"Total rules: {len(rulebook.get('rules', []))}")
         with tab4:
-            UIComponents._render_results_preview(results_df)
+            UIComponents._render_results_preview(results_df, display_cols, issue_mask)
+
+    @staticmethod
+    def _score_frame(scores: Dict[str, float], label: str, sort: bool = False) -> pd.DataFrame:
+        """(label, DQ Score (%), Status) frame built column-wise from a score dict."""
+        names  = np.fromiter(scores.keys(), dtype=object, count=len(scores))
+        values = np.fromiter(scores.values(), dtype=float, count=len(scores))
+        if sort:
+            order = np.argsort(values, kind="stable")
+            names, values = names[order], values[order]
+        status = np.where(values == 100, "✅ PASSED", "❌ FAILED").astype(object)
+        return pd.DataFrame({label: names, "DQ Score (%)": values, "Status": status})
 
     @staticmethod
     def _render_column_scores(column_scores: Dict[str, float]):
-        score_data = []
-        for col, score in sorted(column_scores.items(), key=lambda x: x[1]):
-            status = "✅ PASSED" if score == 100 else "❌ FAILED"
-            score_data.append({"Column": col, "DQ Score (%)": score, "Status": status})
-        score_df = pd.DataFrame(score_data)
-
-        def color_status(val):
-            if val == "✅ PASSED":
-                return "background-color: #C6EFCE; color: #006100"
-            return "background-color: #FFC7CE; color: #9C0006"
-
-        st.dataframe(
-            score_df.style.applymap(color_status, subset=["Status"]),
-            use_container_width=True, hide_index=True,
+        score_df = UIComponents._score_frame(column_scores, "Column", sort=True)
+
+        # Plain HTML with a CSS class per status: no pandas Styler pass at all
+        rows_html = "".join(
+            f'<tr><td>{html.escape(str(col))}</td><td>{score:.2f}</td>'
+            f'<td class="{_STATUS_CLASS[status]}">{status}</td></tr>'
+            for col, score, status in zip(score_df["Column"].tolist(),
+                                          score_df["DQ Score (%)"].tolist(),
+                                          score_df["Status"].tolist())
+        )
+        st.markdown(
+            '<div class="dq-score-table-wrap"><table class="dq-score-table">'
+            "<thead><tr><th>Column</th><th>DQ Score (%)</th><th>Status</th></tr></thead>"
+            f"<tbody>{rows_html}</tbody></table></div>",
+            unsafe_allow_html=True,
         )
 
     @staticmethod
@@ -199,22 +293,25 @@ class UIComponents:
         if not dimension_scores:
             st.info("No dimension analysis available")
             return
-        dim_data = []
-        for dimension, score in dimension_scores.items():
-            status = "✅ PASSED" if score == 100 else "❌ FAILED"
-            dim_data.append({"Dimension": dimension, "DQ Score (%)": score, "Status": status})
-        st.dataframe(pd.DataFrame(dim_data), use_container_width=True, hide_index=True)
+        st.dataframe(UIComponents._score_frame(dimension_scores, "Dimension"),
+                     use_container_width=True, hide_index=True,
+                     column_config=_SCORE_COLUMN_CONFIG)
 
     @staticmethod
-    def _render_results_preview(results_df: pd.DataFrame):
-        display_cols = [c for c in results_df.columns if not c.startswith("_")]
-        issues_df    = results_df[results_df["Count of issues"] > 0]
-        if len(issues_df) > 0:
-            st.write(f"**Total records with issues: {len(issues_df):,}**")
-            st.dataframe(issues_df[display_cols].head(100), use_container_width=True)
+    def _render_results_preview(
+        results_df: pd.DataFrame,
+        display_cols: List[str],
+        issue_mask: np.ndarray,
+    ):
+        issue_count = int(np.count_nonzero(issue_mask))
+        if issue_count > 0:
+            st.write(f"**Total records with issues: {issue_count:,}**")
+            # Rows are sliced before columns, so only the previewed rows are copied
+            head_rows = np.flatnonzero(issue_mask)[:100]
+            st.dataframe(results_df.take(head_rows)[display_cols], use_container_width=True)
         else:
             st.success("🎉 No issues found! All records passed validation.")
-            st.dataframe(results_df[display_cols].head(20), use_container_width=True)
+            st.dataframe(results_df.head(20)[display_cols], use_container_width=True)
 
     @staticmethod
     def render_error_details(error: Exception):
@@ -223,13 +320,7 @@ class UIComponents:
 
     @staticmethod
     def render_footer():
-        st.markdown(
-            '<div class="text-center margin-top-1">'
-            '<p class="caption">Powered by '
-            + AppConfig.APP_TITLE + " v" + AppConfig.VERSION
-            + "</p></div>",
-            unsafe_allow_html=True,
-        )
+        st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
     # ══════════════════════════════════════════════════════════════════════
     #  ANIMATED GUIDANCE — WORKFLOW TRACKER
@@ -250,43 +341,7 @@ class UIComponents:
         active_step (0–4): current step.
         Steps before it → done (green). Current → animated. After → pending (grey).
         """
-        steps = UIComponents._WORKFLOW_STEPS
-
-        def _bubble_class(i: int) -> str:
-            if i < active_step:
-                return "done"
-            if i == active_step:
-                t = steps[i]["type"]
-                return "active-upload" if t == "upload" else (
-                    "processing" if t == "process" else "active"
-                )
-            return "pending"
-
-        def _bubble_inner(i: int, cls: str) -> str:
-            icon = steps[i]["icon"]
-            if cls == "done":
-                return '<span class="wf-check">✓</span>'
-            if cls == "processing":
-                return icon
-            if cls == "active-upload":
-                return f'<span class="wf-icon">{icon}</span>'
-            return icon
-
-        parts = ['<div class="wf-tracker">']
-        for i, step in enumerate(steps):
-            cls     = _bubble_class(i)
-            inner   = _bubble_inner(i, cls)
-            con_cls = "done" if i < active_step else ""
-            parts.append(f"""
-                <div class="wf-step">
-                    <div class="wf-bubble {cls}">{inner}</div>
-                    <span class="wf-label">{step['label']}</span>
-                </div>
-            """)
-            if i < len(steps) - 1:
-                parts.append(f'<div class="wf-connector {con_cls}"></div>')
-        parts.append("</div>")
-        st.markdown("".join(parts), unsafe_allow_html=True)
+        st.markdown(_workflow_tracker_html(active_step), unsafe_allow_html=True)
 
     # ══════════════════════════════════════════════════════════════════════
     #  ANIMATED GUIDANCE — LOTTIE PLAYERS
@@ -328,8 +383,12 @@ class UIComponents:
     @staticmethod
     def render_lottie_success(label: str = "Assessment complete!") -> None:
         _inject_lottie_lib()
+        st.markdown(UIComponents._lottie_success_html(label), unsafe_allow_html=True)
+
+    @staticmethod
+    def _lottie_success_html(label: str) -> str:
         player = _lottie_player(_LOTTIE_URLS["success"], "lottie-analytics-fallback")
-        st.markdown(f"""
+        return f"""
             <div class="lottie-slot">
                 <div class="lottie-frame"
                      style="border-color:rgba(16,185,129,0.4);
@@ -338,13 +397,14 @@ class UIComponents:
                 </div>
                 <span class="lottie-caption" style="color:#34d399;">{label}</span>
             </div>
-        """, unsafe_allow_html=True)
+        """
 
     # ══════════════════════════════════════════════════════════════════════
     #  ANIMATED GUIDANCE — HINT PRIMITIVES
     # ══════════════════════════════════════════════════════════════════════
 
     @staticmethod
+    @functools.lru_cache(maxsize=16)
     def render_beacon(color: str = "#60a5fa") -> str:
         """Return beacon HTML (embed inside other HTML strings)."""
         return f"""
@@ -366,15 +426,20 @@ class UIComponents:
         title: str, message: str, color: str = "#60a5fa"
     ) -> None:
         """Animated beacon + text strip. message supports inline HTML."""
+        st.markdown(UIComponents._action_hint_bar_html(title, message, color),
+                    unsafe_allow_html=True)
+
+    @staticmethod
+    def _action_hint_bar_html(title: str, message: str, color: str) -> str:
         beacon = UIComponents.render_beacon(color)
-        st.markdown(f"""
+        return f"""
             <div class="action-hint-bar">
                 <div class="ahb-beacon">{beacon}</div>
                 <div class="ahb-text">
                     <strong>{title}:</strong> {message}
                 </div>
             </div>
-        """, unsafe_allow_html=True)
+        """
 
     @staticmethod
     def render_arrow_down(color: str = "#60a5fa") -> None:
@@ -428,14 +493,7 @@ class UIComponents:
         """, unsafe_allow_html=True)
     @staticmethod
     def render_orbit_loader() -> None:
-        st.markdown("""
-            <div class="orbit-loader">
-                <div class="center-dot"></div>
-                <div class="orbiter"></div>
-                <div class="orbiter"></div>
-                <div class="orbiter"></div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_ORBIT_LOADER_HTML, unsafe_allow_html=True)
 
     # ══════════════════════════════════════════════════════════════════════
     #  ANIMATED GUIDANCE — COMPOSITE PANELS
@@ -448,13 +506,18 @@ class UIComponents:
         Call this immediately BEFORE st.file_uploader().
         file_type: 'dataset' | 'rules'
         """
+        st.markdown(UIComponents._upload_hint_html(file_type), unsafe_allow_html=True)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _upload_hint_html(file_type: str) -> str:
         if file_type == "dataset":
             icon, title, tip = "📋", "Master Dataset", "CSV, Excel, JSON, Parquet or ODS"
         else:
             icon, title, tip = "📜", "Rules Configuration", "CSV/Excel rules sheet or JSON rulebook"
 
         beacon = UIComponents.render_beacon()
-        st.markdown(f"""
+        return f"""
             <div class="action-hint-bar" style="margin-bottom:0.5rem;">
                 <div class="ahb-beacon">{beacon}</div>
                 <div class="ahb-text">
@@ -465,7 +528,7 @@ class UIComponents:
                     </span>
                 </div>
             </div>
-        """, unsafe_allow_html=True)
+        """
 
     @staticmethod
     def render_welcome_screen() -> None:
@@ -479,18 +542,23 @@ class UIComponents:
         Shows completed tracker + lottie success + action hint.
         """
         _inject_lottie_lib()
-        UIComponents.render_workflow_tracker(active_step=4)
 
         color = "#10b981" if score >= 80 else ("#f59e0b" if score >= 60 else "#ef4444")
         emoji = "🎉"      if score >= 80 else ("👍"      if score >= 60 else "⚠️")
 
-        _, col_c, _ = st.columns([1, 1.2, 1])
-        with col_c:
-            UIComponents.render_lottie_success(f"{emoji} Score: {score:.1f}%")
-
-        UIComponents.render_action_hint_bar(
+        hint = UIComponents._action_hint_bar_html(
             title="Assessment complete",
             message="Download your <strong>Excel report</strong> below or "
                     "continue to the <strong>Maturity Assessment →</strong>",
             color=color,
+        )
+        # One markdown message; the success panel is centred the way the
+        # former [1, 1.2, 1] column layout placed it
+        st.markdown(
+            _workflow_tracker_html(4)
+            + '<div style="width:37.5%;margin:0 auto;">'
+            + UIComponents._lottie_success_html(f"{emoji} Score: {score:.1f}%")
+            + "</div>"
+            + hint,
+            unsafe_allow_html=True,
         )
\ No newline at end of file
@@ -2,11 +2,17 @@
 Enterprise Maturity Slide Visualization
 """
 
+import functools
+import threading
 import numpy as np
 from io import BytesIO
 from datetime import datetime
-import matplotlib.pyplot as plt
+from PIL import Image
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.patches import Wedge, Circle, Rectangle
+from matplotlib.collections import PatchCollection
+from matplotlib.text import Text
 
 UNIQU_PURPLE = "#6A0DAD"
 UNIQU_MAGENTA = "#FF00FF"
@@ -14,6 +20,10 @@ UNIQU_LIGHT_BG = "#F8F5FF"
 UNIQU_TEXT = "#2E2E2E"
 UNIQU_GREY = "#B0B0B0"
 
+_DONUT_CENTERS = ((0.60, 0.22), (0.72, 0.22), (0.84, 0.22))
+_DONUT_COLORS = (UNIQU_PURPLE, UNIQU_MAGENTA, "#a083c9")
+_SLIDE_LOCK = threading.Lock()      # the cached slide canvas is shared by all sessions
+
 
 # ─────────────────────────────
 # Helpers
@@ -78,16 +88,20 @@ def _draw_maturity_wheel(ax, center=(0.18, 0.44), r_outer=0.20, r_inner=0.09):
 # ─────────────────────────────
 # Domain Table
 # ─────────────────────────────
-def _draw_domain_table(ax, scores):
+_TABLE_BOX = (0.52, 0.52, 0.38, 0.23)
+_TABLE_HEADER_H = 0.07
+
+
+def _draw_domain_frame(ax):
 
-    x, y, w, h = 0.52, 0.52, 0.38, 0.23
+    x, y, w, h = _TABLE_BOX
 
     ax.add_patch(Rectangle((x, y), w, h,
                            transform=ax.transAxes,
                            facecolor="white",
                            edgecolor=UNIQU_GREY))
 
-    hh = 0.07
+    hh = _TABLE_HEADER_H
     ax.add_patch(Rectangle((x, y + h - hh), w, hh,
                            transform=ax.transAxes,
                            facecolor="#c07bb3"))
@@ -99,74 +113,102 @@ def _draw_domain_table(ax, scores):
             transform=ax.transAxes,
             va="center")
 
-    rows = list(scores.keys())
-    row_h = (h - hh) / len(rows)
 
-    for i, r in enumerate(rows):
+def _domain_row_texts(ax, scores):
+    """Row texts of the domain table as free-standing Text artists.
 
-        val = scores[r]
-        yy = y + h - hh - (i + 1) * row_h + 0.02
+    They are only blitted onto the cached slide, so they skip registration
+    with (and removal from) the axes.
+    """
 
-        ax.text(x + 0.02, yy, r,
-                fontsize=9,
-                transform=ax.transAxes,
-                color=UNIQU_TEXT)
+    x, y, w, h = _TABLE_BOX
+    hh = _TABLE_HEADER_H
 
-        ax.text(x + 0.26, yy, f"{val:.1f}",
-                fontsize=9,
-                transform=ax.transAxes)
+    rows = list(scores.keys())
+    row_h = (h - hh) / len(rows)
+    top = y + h - hh + 0.02
+    ys = top - row_h * np.arange(1, len(rows) + 1)
+
+    texts = [Text(x + 0.02, yy, r, fontsize=9, color=UNIQU_TEXT, transform=ax.transAxes)
+             for r, yy in zip(rows, ys.tolist())]
+    texts += [Text(x + 0.26, yy, f"{scores[r]:.1f}", fontsize=9, transform=ax.transAxes)
+              for r, yy in zip(rows, ys.tolist())]
+    for text in texts:
+        text.set_figure(ax.figure)
+    return texts
 
 
 # ─────────────────────────────
 # Donut
 # ─────────────────────────────
-def _draw_donut(ax, center, value, label, color):
+_DONUT_R = 0.04
+_DONUT_WIDTH = 0.01
+
+
+def _donut_wedges(values=None):
+    """One wedge per donut centre: full rings, or value arcs (value out of 5)."""
+    if values is None:
+        return [Wedge(c, _DONUT_R, 0, 360, width=_DONUT_WIDTH) for c in _DONUT_CENTERS]
+    theta1 = 90 - 360 * (np.asarray(values, dtype=float) / 5)
+    return [Wedge(c, _DONUT_R, t1, 90, width=_DONUT_WIDTH)
+            for c, t1 in zip(_DONUT_CENTERS, theta1.tolist())]
+
 
-    r = 0.04
+def _draw_donut_rings(ax):
+    """The three background rings as a single collection."""
 
-    ax.add_patch(Wedge(
-        center, r, 0, 360,
-        width=0.01,
+    ax.add_collection(PatchCollection(
+        _donut_wedges(),
         transform=ax.transAxes,
-        facecolor="#efe9f7"
+        facecolor="#efe9f7",
+        edgecolor="none"
     ))
 
-    frac = value / 5
 
-    ax.add_patch(Wedge(
-        center, r,
-        90 - 360 * frac, 90,
-        width=0.01,
+def _draw_donut_arcs(ax):
+    """The three value arcs as a single collection, updated per render."""
+
+    return ax.add_collection(PatchCollection(
+        _donut_wedges((0.0, 0.0, 0.0)),
         transform=ax.transAxes,
-        facecolor=color
+        facecolor=_DONUT_COLORS,
+        edgecolor="none"
     ))
 
-    ax.text(center[0], center[1],
-            f"{value:.2f}",
-            transform=ax.transAxes,
-            ha="center", va="center",
-            fontsize=11,
-            fontweight="bold")
 
-    ax.text(center[0], center[1] + 0.08,
-            label,
-            transform=ax.transAxes,
-            ha="center",
-            fontsize=8)
+def _draw_donut_texts(ax, center):
+    """Value and label texts of one donut; returns both artists."""
+
+    value_text = ax.text(center[0], center[1],
+                         "",
+                         transform=ax.transAxes,
+                         ha="center", va="center",
+                         fontsize=11,
+                         fontweight="bold")
+
+    label_text = ax.text(center[0], center[1] + 0.08,
+                         "",
+                         transform=ax.transAxes,
+                         ha="center",
+                         fontsize=8)
+
+    return value_text, label_text
 
 
 # ─────────────────────────────
-# MAIN SLIDE
+# Static Layers
 # ─────────────────────────────
-def render_summary_slide_png(
-    client_name,
-    domain_scores,
-    exec_score,
-    benchmark,
-    target
-):
+@functools.lru_cache(maxsize=1)
+def _slide_canvas():
+    """Figure, axes and rendered background holding everything that does not
+    depend on the client: title, brand, wheel, table frame and donut rings.
+
+    Also returns the reusable per-client artists (donut arcs and texts, footer),
+    created after the background is captured and updated in place per call.
+    """
 
-    fig = plt.figure(figsize=(13.6, 7.65), dpi=160)
+    fig = Figure(figsize=(13.6, 7.65), dpi=160)
+    canvas = FigureCanvasAgg(fig)
     ax = fig.add_axes([0, 0, 1, 1])
     ax.axis("off")
 
@@ -197,21 +239,65 @@ def render_summary_slide_png(
     _draw_maturity_wheel(ax)
 
     # Table
-    _draw_domain_table(ax, domain_scores)
+    _draw_domain_frame(ax)
 
-    # Donuts
-    _draw_donut(ax, (0.60, 0.22), exec_score, client_name, UNIQU_PURPLE)
-    _draw_donut(ax, (0.72, 0.22), benchmark, "Benchmark", UNIQU_MAGENTA)
-    _draw_donut(ax, (0.84, 0.22), target, "Target", "#a083c9")
+    # Donut rings
+    _draw_donut_rings(ax)
+
+    canvas.draw()
+    background = canvas.copy_from_bbox(fig.bbox)
+
+    arcs = _draw_donut_arcs(ax)
+    donut_texts = [_draw_donut_texts(ax, center) for center in _DONUT_CENTERS]
 
     # Footer
-    ax.text(0.05, 0.04,
-            f"Data Maturity Assessment Report for {client_name}",
-            fontsize=10,
-            transform=ax.transAxes)
+    footer = ax.text(0.05, 0.04, "",
+                     fontsize=10,
+                     transform=ax.transAxes)
+
+    return fig, ax, background, arcs, donut_texts, footer
+
 
-    buf = BytesIO()
-    fig.savefig(buf, format="png", bbox_inches=None, pad_inches=0.0)
-    plt.close(fig)
+# ─────────────────────────────
+# MAIN SLIDE
+# ─────────────────────────────
+def render_summary_slide_png(
+    client_name,
+    domain_scores,
+    exec_score,
+    benchmark,
+    target
+):
 
-    return buf.getvalue()
\ No newline at end of file
+    with _SLIDE_LOCK:
+        fig, ax, background, arcs, donut_texts, footer = _slide_canvas()
+        canvas = fig.canvas
+        canvas.restore_region(background)
+
+        # Client-specific layers, blitted over the cached background
+        values = (exec_score, benchmark, target)
+        labels = (client_name, "Benchmark", "Target")
+        arcs.set_paths(_donut_wedges(values))
+        for (value_text, label_text), value, label in zip(donut_texts, values, labels):
+            value_text.set_text(f"{value:.2f}")
+            label_text.set_text(label)
+        footer.set_text(f"Data Maturity Assessment Report for {client_name}")
+
+        # Patches under texts, as in a full figure draw
+        ax.draw_artist(arcs)
+        for value_text, label_text in donut_texts:
+            ax.draw_artist(value_text)
+            ax.draw_artist(label_text)
+        ax.draw_artist(footer)
+        for text in _domain_row_texts(ax, domain_scores):
+            ax.draw_artist(text)
+
+        width, height = canvas.get_width_height()
+        img = Image.frombuffer("RGBA", (width, height), canvas.buffer_rgba(), "raw", "RGBA", 0, 1)
+
+        # Fast zlib level: the slide is mostly flat colour, so size grows
+        # modestly while encoding takes about a quarter less time
+        buf = BytesIO()
+        img.save(buf, "PNG", compress_level=1)
+
+    return buf.getvalue()